@@ -172,57 +172,62 @@ impl DatabaseAdapter for CachedDatabaseAdapter {
         alias: &str,
         bypass_cache: bool,
     ) -> QuickDbResult<Vec<DataValue>> {
-        // 生成条件组合查询缓存键
+        // 强制跳过缓存或缓存未启用时直接查询数据库，无需生成缓存键
+        if bypass_cache || !self.cache_manager.is_enabled() {
+            if bypass_cache {
+                debug!("强制跳过缓存: 表={}", table);
+            }
+            return self
+                .inner
+                .find_with_groups_with_config(connection, table, condition_groups, options, alias)
+                .await;
+        }
+
+        // 生成条件组合查询缓存键，读取和写入缓存共用同一个键
         let cache_key = self.cache_manager.generate_condition_groups_with_config_cache_key(
             table,
             condition_groups,
             options,
         );
 
-        // 如果不跳过缓存，先检查缓存
-        if !bypass_cache {
-            match self
-                .cache_manager
-                .get_cached_condition_groups_with_config_result(table, condition_groups, options)
-                .await
-            {
-                Ok(Some(cached_result)) => {
-                    debug!("条件组合查询缓存命中: 表={}, 键={}", table, cache_key);
-                    return Ok(cached_result);
-                }
-                Ok(None) => {
-                    debug!("条件组合查询缓存未命中: 表={}, 键={}", table, cache_key);
-                }
-                Err(e) => {
-                    warn!("获取条件组合查询缓存失败: {}", e);
-                }
+        // 先检查缓存
+        match self
+            .cache_manager
+            .get_cached_result_with_key(table, &cache_key)
+            .await
+        {
+            Ok(Some(cached_result)) => {
+                debug!("条件组合查询缓存命中: 表={}, 键={}", table, cache_key);
+                return Ok(cached_result);
+            }
+            Ok(None) => {
+                debug!("条件组合查询缓存未命中: 表={}, 键={}", table, cache_key);
+            }
+            Err(e) => {
+                warn!("获取条件组合查询缓存失败: {}", e);
             }
-        } else {
-            debug!("强制跳过缓存: 表={}, 键={}", table, cache_key);
         }
 
-        // 查询数据库（缓存未命中或强制跳过缓存）
+        // 缓存未命中，查询数据库
         let result = self
             .inner
             .find_with_groups_with_config(connection, table, condition_groups, options, alias)
             .await?;
 
-        // 缓存查询结果（仅在不跳过缓存时）
-        if !bypass_cache {
-            if let Err(e) = self
-                .cache_manager
-                .cache_condition_groups_with_config_result(table, condition_groups, options, &result)
-                .await
-            {
-                warn!("缓存条件组合查询结果失败: {}", e);
-            } else {
-                debug!(
-                    "已缓存条件组合查询结果: 表={}, 键={}, 结果数量={}",
-                    table,
-                    cache_key,
-                    result.len()
-                );
-            }
+        // 缓存查询结果
+        if let Err(e) = self
+            .cache_manager
+            .cache_result_with_key(table, &cache_key, &result)
+            .await
+        {
+            warn!("缓存条件组合查询结果失败: {}", e);
+        } else {
+            debug!(
+                "已缓存条件组合查询结果: 表={}, 键={}, 结果数量={}",
+                table,
+                cache_key,
+                result.len()
+            );
         }
 
         Ok(result)
@@ -50,10 +50,12 @@ impl DatabaseAdapter for MongoAdapter {
                 // 双重检查：再次确认集合不存在
                 if !mongodb_schema::table_exists(self, connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                         debug!("集合 {} 不存在，使用预定义模型元数据创建", table);
 
                         // MongoDB不需要预创建表结构，集合是无模式的
+                        // 集合会随写入隐式创建且不带索引，需要让下次确认流程补建索引
+                        crate::manager::invalidate_ensured_table(table, alias);
                     } else {
                         return Err(QuickDbError::ValidationError {
                             field: "collection_creation".to_string(),
@@ -230,10 +232,12 @@ impl DatabaseAdapter for MongoAdapter {
                 // 双重检查：再次确认集合不存在
                 if !mongodb_schema::table_exists(self, connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                         debug!("集合 {} 不存在，使用预定义模型元数据创建", table);
 
                         // MongoDB不需要预创建表结构，集合是无模式的
+                        // 集合会随写入隐式创建且不带索引，需要让下次确认流程补建索引
+                        crate::manager::invalidate_ensured_table(table, alias);
                     } else {
                         return Err(QuickDbError::ValidationError {
                             field: "collection_creation".to_string(),
@@ -30,20 +30,8 @@ pub(crate) async fn find_by_id(
 
         let query = match id {
             DataValue::String(id_str) => {
-                // 处理ObjectId格式：ObjectId("xxx") 或直接是ObjectId字符串
-                let actual_id = if id_str.starts_with("ObjectId(\"") && id_str.ends_with("\")") {
-                    // 提取ObjectId字符串部分
-                    &id_str[10..id_str.len() - 2]
-                } else {
-                    id_str
-                };
-
-                // 尝试解析为ObjectId，如果失败则作为字符串查询
-                if let Ok(object_id) = mongodb::bson::oid::ObjectId::parse_str(actual_id) {
-                    doc! { "_id": object_id }
-                } else {
-                    doc! { "_id": actual_id }
-                }
+                // 处理ObjectId格式：ObjectId("xxx") 或直接是ObjectId字符串，解析失败则作为字符串查询
+                doc! { "_id": crate::adapter::mongodb::query_builder::id_string_to_bson(id_str) }
             }
             _ => {
                 match crate::adapter::mongodb::utils::data_value_to_bson(adapter, id) {
@@ -19,6 +19,32 @@ fn map_field_name(field_name: &str) -> &str {
     }
 }
 
+/// 将主键字符串转换为BSON值
+///
+/// 与 `find_by_id` 保持一致：去掉 `ObjectId("...")` 包装，能解析为ObjectId的按ObjectId查询，
+/// 否则保持字符串
+pub(crate) fn id_string_to_bson(id_str: &str) -> Bson {
+    let actual_id = if id_str.starts_with("ObjectId(\"") && id_str.ends_with("\")") {
+        &id_str[10..id_str.len() - 2]
+    } else {
+        id_str
+    };
+
+    match mongodb::bson::oid::ObjectId::parse_str(actual_id) {
+        Ok(object_id) => Bson::ObjectId(object_id),
+        Err(_) => Bson::String(actual_id.to_string()),
+    }
+}
+
+/// 规范化 `_id` 条件中的字符串值（含 IN/NOT IN 数组中的元素）
+fn normalize_id_bson(value: Bson) -> Bson {
+    match value {
+        Bson::String(s) => id_string_to_bson(&s),
+        Bson::Array(arr) => Bson::Array(arr.into_iter().map(normalize_id_bson).collect()),
+        other => other,
+    }
+}
+
 /// MongoDB查询构建器
 pub struct MongoQueryBuilder {
     conditions: Vec<QueryConditionWithConfig>,
@@ -258,6 +284,15 @@ impl MongoQueryBuilder {
             } else {
                 self.data_value_to_bson(&condition.value)
             }
+        } else if field_name == "_id"
+            && matches!(
+                condition.operator,
+                QueryOperator::Eq | QueryOperator::Ne | QueryOperator::In | QueryOperator::NotIn
+            )
+        {
+            // 主键的等值/集合比较按 find_by_id 的规则处理，保证 `id IN (...)` 能命中ObjectId主键；
+            // 字符串类操作符（StartsWith、Regex等）和范围比较保持原始值
+            normalize_id_bson(self.data_value_to_bson(&condition.value))
         } else {
             self.data_value_to_bson(&condition.value)
         };
@@ -650,4 +685,49 @@ mod tests {
         assert!(doc.contains_key("_id"));
         assert!(!doc.contains_key("id"));
     }
+
+    #[test]
+    fn test_id_in_condition_normalizes_object_ids() {
+        let hex = "507f1f77bcf86cd799439011";
+        let conditions = vec![QueryConditionWithConfig {
+            field: "id".to_string(),
+            operator: crate::types::QueryOperator::In,
+            value: crate::types::DataValue::Array(vec![
+                crate::types::DataValue::String(hex.to_string()),
+                crate::types::DataValue::String(format!("ObjectId(\"{}\")", hex)),
+                crate::types::DataValue::String("plain-id".to_string()),
+            ]),
+            case_insensitive: false,
+        }];
+
+        let doc = build_query_document("users", "test", &conditions).unwrap();
+        let in_values = doc
+            .get_document("_id")
+            .unwrap()
+            .get_array("$in")
+            .unwrap();
+
+        let object_id = mongodb::bson::oid::ObjectId::parse_str(hex).unwrap();
+        assert_eq!(in_values[0], Bson::ObjectId(object_id));
+        assert_eq!(in_values[1], Bson::ObjectId(object_id));
+        assert_eq!(in_values[2], Bson::String("plain-id".to_string()));
+    }
+
+    #[test]
+    fn test_id_starts_with_keeps_string_value() {
+        // 看起来像ObjectId的前缀仍按字符串构建正则，不转换为ObjectId
+        let conditions = vec![QueryConditionWithConfig {
+            field: "id".to_string(),
+            operator: crate::types::QueryOperator::StartsWith,
+            value: crate::types::DataValue::String("507f1f77bcf86cd799439011".to_string()),
+            case_insensitive: false,
+        }];
+
+        let doc = build_query_document("users", "test", &conditions).unwrap();
+        let id_doc = doc.get_document("_id").unwrap();
+        assert_eq!(
+            id_doc.get_str("$regex").unwrap(),
+            "^507f1f77bcf86cd799439011"
+        );
+    }
 }
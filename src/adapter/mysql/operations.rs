@@ -36,7 +36,7 @@ impl DatabaseAdapter for MysqlAdapter {
                 // 再次检查表是否存在（双重检查锁定模式）
                 if !self.table_exists(connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = manager::get_shared_model(table, alias) {
                         debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                         // 使用模型元数据创建表
@@ -48,6 +48,8 @@ impl DatabaseAdapter for MysqlAdapter {
                             alias,
                         )
                         .await?;
+                        // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                        manager::invalidate_ensured_table(table, alias);
                         // 等待100ms确保数据库事务完全提交
                         tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
                         debug!("⏱️ 等待100ms确保表 '{}' 创建完成", table);
@@ -217,7 +219,7 @@ impl DatabaseAdapter for MysqlAdapter {
                 // 再次检查表是否存在（双重检查锁定模式）
                 if !self.table_exists(connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = manager::get_shared_model(table, alias) {
                         debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                         // 使用模型元数据创建表
@@ -229,6 +231,8 @@ impl DatabaseAdapter for MysqlAdapter {
                             alias,
                         )
                         .await?;
+                        // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                        manager::invalidate_ensured_table(table, alias);
                         // 等待100ms确保数据库事务完全提交
                         tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
                         debug!("⏱️ 等待100ms确保表 '{}' 创建完成", table);
@@ -571,7 +575,7 @@ impl DatabaseAdapter for MysqlAdapter {
         if let DatabaseConnection::MySQL(pool) = connection {
             // 获取字段元数据进行验证和转换
             let model_meta =
-                crate::manager::get_model_with_alias(table, alias).ok_or_else(|| {
+                crate::manager::get_shared_model(table, alias).ok_or_else(|| {
                     QuickDbError::ValidationError {
                         field: "model".to_string(),
                         message: format!("模型 '{}' 不存在", table),
@@ -579,12 +583,7 @@ impl DatabaseAdapter for MysqlAdapter {
                 })?;
 
             // 验证字段存在性，并处理DateTimeWithTz字段转换
-            let field_map: std::collections::HashMap<String, crate::model::FieldDefinition> =
-                model_meta
-                    .fields
-                    .iter()
-                    .map(|(name, f)| (name.clone(), f.clone()))
-                    .collect();
+            let field_map = &model_meta.fields;
 
             let mut validated_data = HashMap::new();
             for (field_name, data_value) in data {
@@ -8,7 +8,7 @@ use crate::types::{
     DataValue, LogicalOperator, QueryCondition, QueryConditionGroup, QueryOperator,
 };
 use async_trait::async_trait;
-use rat_logger::{debug, error, warn};
+use rat_logger::{error, warn};
 use serde_json::Value as JsonValue;
 use sqlx::mysql::MySqlRow;
 use sqlx::{Column, MySql, Pool, Row, TypeInfo};
@@ -129,14 +129,14 @@ impl MysqlAdapter {
 
     /// 安全读取JSON字段，处理MySQL中JSON的多种存储格式
     pub fn safe_read_json(row: &MySqlRow, column_name: &str) -> QuickDbResult<DataValue> {
-        debug!("开始安全读取JSON字段: {}", column_name);
+        crate::debug_log!("开始安全读取JSON字段: {}", column_name);
 
         // 1. 首先尝试直接解析为JsonValue（标准的JSON字段）
         let direct_json_result = row.try_get::<Option<JsonValue>, _>(column_name);
-        debug!("直接解析JsonValue结果: {:?}", direct_json_result);
+        crate::debug_log!("直接解析JsonValue结果: {:?}", direct_json_result);
 
         if let Ok(value) = direct_json_result {
-            debug!("成功直接解析为JsonValue: {:?}", value);
+            crate::debug_log!("成功直接解析为JsonValue: {:?}", value);
             return Ok(match value {
                 Some(json) => DataValue::Json(json),
                 None => DataValue::Null,
@@ -145,23 +145,23 @@ impl MysqlAdapter {
 
         // 2. 如果直接解析失败，尝试读取为字符串，然后解析为JSON
         let string_result = row.try_get::<Option<String>, _>(column_name);
-        debug!("读取为字符串结果: {:?}", string_result);
+        crate::debug_log!("读取为字符串结果: {:?}", string_result);
 
         if let Ok(value) = string_result {
             match value {
                 Some(s) => {
-                    debug!(
+                    crate::debug_log!(
                         "获取到字符串值，长度: {}, 前50字符: {}",
                         s.len(),
                         &s[..s.len().min(50)]
                     );
                     // 检查是否是JSON字符串格式（以{或[开头）
                     if s.starts_with('{') || s.starts_with('[') {
-                        debug!("检测到JSON格式字符串，尝试解析");
+                        crate::debug_log!("检测到JSON格式字符串，尝试解析");
                         // 尝试解析为JSON值
                         match serde_json::from_str::<JsonValue>(&s) {
                             Ok(json_value) => {
-                                debug!("JSON字符串解析成功: {:?}", json_value);
+                                crate::debug_log!("JSON字符串解析成功: {:?}", json_value);
                                 // 直接根据JSON类型转换为对应的DataValue
                                 // 这样可以避免DataValue::Json包装，确保Object字段正确解析
                                 match json_value {
@@ -169,7 +169,7 @@ impl MysqlAdapter {
                                         let data_object: HashMap<String, DataValue> = obj.into_iter()
                                             .map(|(k, v)| (k, crate::types::data_value::json_value_to_data_value(v)))
                                             .collect();
-                                        debug!(
+                                        crate::debug_log!(
                                             "转换为DataValue::Object，包含{}个字段",
                                             data_object.len()
                                         );
@@ -184,14 +184,14 @@ impl MysqlAdapter {
                                                 )
                                             })
                                             .collect();
-                                        debug!(
+                                        crate::debug_log!(
                                             "转换为DataValue::Array，包含{}个元素",
                                             data_array.len()
                                         );
                                         Ok(DataValue::Array(data_array))
                                     }
                                     _ => {
-                                        debug!("转换为其他DataValue类型");
+                                        crate::debug_log!("转换为其他DataValue类型");
                                         Ok(crate::types::data_value::json_value_to_data_value(
                                             json_value,
                                         ))
@@ -205,13 +205,13 @@ impl MysqlAdapter {
                             }
                         }
                     } else {
-                        debug!("不是JSON格式字符串，返回DataValue::String");
+                        crate::debug_log!("不是JSON格式字符串，返回DataValue::String");
                         // 不是JSON格式，作为普通字符串处理
                         Ok(DataValue::String(s))
                     }
                 }
                 None => {
-                    debug!("字符串值为None，返回DataValue::Null");
+                    crate::debug_log!("字符串值为None，返回DataValue::Null");
                     Ok(DataValue::Null)
                 }
             }
@@ -271,7 +271,7 @@ impl MysqlAdapter {
             let column_type = column.type_info().name();
 
             // 调试：输出列类型信息
-            debug!(
+            crate::debug_log!(
                 "开始处理MySQL列 '{}' 的类型: '{}'",
                 column_name, column_type
             );
@@ -279,11 +279,11 @@ impl MysqlAdapter {
             // 根据MySQL类型转换值
             let data_value = match column_type {
                 "INT" | "BIGINT" | "SMALLINT" | "TINYINT" => {
-                    debug!("准备读取整数字段: {}", column_name);
+                    crate::debug_log!("准备读取整数字段: {}", column_name);
                     // 使用安全的整数读取方法，防止 byteorder 错误
                     match Self::safe_read_integer(row, column_name) {
                         Ok(value) => {
-                            debug!("成功读取整数字段 {}: {:?}", column_name, value);
+                            crate::debug_log!("成功读取整数字段 {}: {:?}", column_name, value);
                             value
                         }
                         Err(e) => {
@@ -359,10 +359,10 @@ impl MysqlAdapter {
                     }
                 }
                 "FLOAT" | "DOUBLE" => {
-                    debug!("准备读取浮点数字段: {}", column_name);
+                    crate::debug_log!("准备读取浮点数字段: {}", column_name);
                     match Self::safe_read_float(row, column_name) {
                         Ok(value) => {
-                            debug!("成功读取浮点数字段 {}: {:?}", column_name, value);
+                            crate::debug_log!("成功读取浮点数字段 {}: {:?}", column_name, value);
                             value
                         }
                         Err(e) => {
@@ -372,10 +372,10 @@ impl MysqlAdapter {
                     }
                 }
                 "BOOLEAN" | "BOOL" => {
-                    debug!("准备读取布尔字段: {}", column_name);
+                    crate::debug_log!("准备读取布尔字段: {}", column_name);
                     match Self::safe_read_bool(row, column_name) {
                         Ok(value) => {
-                            debug!("成功读取布尔字段 {}: {:?}", column_name, value);
+                            crate::debug_log!("成功读取布尔字段 {}: {:?}", column_name, value);
                             value
                         }
                         Err(e) => {
@@ -385,13 +385,13 @@ impl MysqlAdapter {
                     }
                 }
                 "CHAR" => {
-                    debug!("准备读取字符串字段: {}", column_name);
+                    crate::debug_log!("准备读取字符串字段: {}", column_name);
                     if let Ok(value) = row.try_get::<Option<String>, _>(column_name) {
                         let result = match value {
                             Some(s) => DataValue::String(s),
                             None => DataValue::Null,
                         };
-                        debug!("成功读取字符串字段 {}: {:?}", column_name, result);
+                        crate::debug_log!("成功读取字符串字段 {}: {:?}", column_name, result);
                         result
                     } else {
                         error!("无法读取字符串字段: {}", column_name);
@@ -400,13 +400,13 @@ impl MysqlAdapter {
                 }
                 "JSON" | "LONGTEXT" | "TEXT" | "VARCHAR" => {
                     // 简化处理：所有文本类型都作为字符串读取
-                    debug!("读取文本字段: {} (类型: {})", column_name, column_type);
+                    crate::debug_log!("读取文本字段: {} (类型: {})", column_name, column_type);
                     if let Ok(value) = row.try_get::<Option<String>, _>(column_name) {
                         let result = match value {
                             Some(s) => DataValue::String(s),
                             None => DataValue::Null,
                         };
-                        debug!("读取文本字段 {}: {:?}", column_name, result);
+                        crate::debug_log!("读取文本字段 {}: {:?}", column_name, result);
                         result
                     } else {
                         error!("无法读取文本字段: {}", column_name);
@@ -415,7 +415,7 @@ impl MysqlAdapter {
                 }
                 "BLOB" => {
                     // BLOB类型可能存储JSON数据，需要作为字节数组读取然后转换为字符串
-                    debug!("读取BLOB字段: {} (类型: {})", column_name, column_type);
+                    crate::debug_log!("读取BLOB字段: {} (类型: {})", column_name, column_type);
                     if let Ok(value) = row.try_get::<Option<Vec<u8>>, _>(column_name) {
                         let result = match value {
                             Some(bytes) => {
@@ -430,7 +430,7 @@ impl MysqlAdapter {
                             }
                             None => DataValue::Null,
                         };
-                        debug!("读取BLOB字段 {}: {:?}", column_name, result);
+                        crate::debug_log!("读取BLOB字段 {}: {:?}", column_name, result);
                         result
                     } else {
                         error!("无法读取BLOB字段: {}", column_name);
@@ -438,7 +438,7 @@ impl MysqlAdapter {
                     }
                 }
                 "DATETIME" | "TIMESTAMP" => {
-                    debug!("准备读取日期时间字段: {}", column_name);
+                    crate::debug_log!("准备读取日期时间字段: {}", column_name);
                     if let Ok(value) =
                         row.try_get::<Option<chrono::DateTime<chrono::Utc>>, _>(column_name)
                     {
@@ -448,7 +448,7 @@ impl MysqlAdapter {
                             }
                             None => DataValue::Null,
                         };
-                        debug!("成功读取日期时间字段 {}: {:?}", column_name, result);
+                        crate::debug_log!("成功读取日期时间字段 {}: {:?}", column_name, result);
                         result
                     } else {
                         error!("无法读取日期时间字段: {}", column_name);
@@ -456,7 +456,7 @@ impl MysqlAdapter {
                     }
                 }
                 _ => {
-                    debug!(
+                    crate::debug_log!(
                         "处理未知类型字段: {} (类型: '{}', 长度: {})",
                         column_name,
                         column_type,
@@ -468,7 +468,7 @@ impl MysqlAdapter {
                             Some(s) => DataValue::String(s),
                             None => DataValue::Null,
                         };
-                        debug!("成功读取未知类型字段 {}: {:?}", column_name, result);
+                        crate::debug_log!("成功读取未知类型字段 {}: {:?}", column_name, result);
                         result
                     } else {
                         error!("无法读取未知类型字段: {}", column_name);
@@ -38,7 +38,7 @@ impl DatabaseAdapter for PostgresAdapter {
                 // 再次检查表是否存在（双重检查锁定模式）
                 if !postgres_schema::table_exists(self, connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                         debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                         // 使用模型元数据创建表
@@ -51,6 +51,8 @@ impl DatabaseAdapter for PostgresAdapter {
                             alias,
                         )
                         .await?;
+                        // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                        crate::manager::invalidate_ensured_table(table, alias);
 
                         // 等待100ms确保数据库事务完全提交
                         tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
@@ -169,7 +171,7 @@ impl DatabaseAdapter for PostgresAdapter {
                 // 再次检查表是否存在（双重检查锁定模式）
                 if !postgres_schema::table_exists(self, connection, table).await? {
                     // 尝试从模型管理器获取预定义的元数据
-                    if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                    if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                         debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                         // 使用模型元数据创建表
@@ -182,6 +184,8 @@ impl DatabaseAdapter for PostgresAdapter {
                             alias,
                         )
                         .await?;
+                        // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                        crate::manager::invalidate_ensured_table(table, alias);
 
                         // 等待100ms确保数据库事务完全提交
                         tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
@@ -469,7 +473,7 @@ impl DatabaseAdapter for PostgresAdapter {
         if let DatabaseConnection::PostgreSQL(pool) = connection {
             // 获取字段元数据进行验证和转换
             let model_meta =
-                crate::manager::get_model_with_alias(table, alias).ok_or_else(|| {
+                crate::manager::get_shared_model(table, alias).ok_or_else(|| {
                     QuickDbError::ValidationError {
                         field: "model".to_string(),
                         message: format!("模型 '{}' 不存在", table),
@@ -477,12 +481,7 @@ impl DatabaseAdapter for PostgresAdapter {
                 })?;
 
             // 验证字段存在性，并处理DateTimeWithTz字段转换
-            let field_map: std::collections::HashMap<String, crate::model::FieldDefinition> =
-                model_meta
-                    .fields
-                    .iter()
-                    .map(|(name, f)| (name.clone(), f.clone()))
-                    .collect();
+            let field_map = &model_meta.fields;
 
             let mut validated_data = HashMap::new();
             for (field_name, data_value) in data {
@@ -3,7 +3,6 @@
 use crate::adapter::postgres::PostgresAdapter;
 use crate::error::{QuickDbError, QuickDbResult};
 use crate::types::DataValue;
-use rat_logger::debug;
 use serde_json::Value;
 use sqlx::{Column, Row, TypeInfo};
 use std::collections::HashMap;
@@ -112,7 +111,7 @@ pub(crate) fn row_to_data_map(
                 if let Ok(val) = row.try_get::<Option<Vec<String>>, _>(column_name) {
                     match val {
                         Some(arr) => {
-                            debug!(
+                            crate::debug_log!(
                                 "PostgreSQL数组字段 {} 转换为DataValue::Array，元素数量: {}",
                                 column_name,
                                 arr.len()
@@ -126,14 +125,14 @@ pub(crate) fn row_to_data_map(
                     }
                 } else {
                     // 如果字符串数组读取失败，尝试其他方法
-                    debug!(
+                    crate::debug_log!(
                         "PostgreSQL数组字段 {} 无法作为字符串数组读取，尝试作为JSON",
                         column_name
                     );
                     if let Ok(val) = row.try_get::<Option<serde_json::Value>, _>(column_name) {
                         match val {
                             Some(json_val) => {
-                                debug!(
+                                crate::debug_log!(
                                     "PostgreSQL数组字段 {} 作为JSON处理: {:?}",
                                     column_name, json_val
                                 );
@@ -142,7 +141,7 @@ pub(crate) fn row_to_data_map(
                             None => DataValue::Null,
                         }
                     } else {
-                        debug!("PostgreSQL数组字段 {} 读取失败，设置为Null", column_name);
+                        crate::debug_log!("PostgreSQL数组字段 {} 读取失败，设置为Null", column_name);
                         DataValue::Null
                     }
                 }
@@ -6,7 +6,6 @@
 use crate::error::{QuickDbError, QuickDbResult};
 use crate::model::{FieldDefinition, FieldType};
 use crate::types::*;
-use rat_logger::debug;
 use sqlx::{Column, Row, sqlite::SqliteRow};
 use std::collections::HashMap;
 
@@ -22,7 +21,7 @@ pub fn row_to_data_map_with_metadata(
     row: &SqliteRow,
     fields: &HashMap<String, FieldDefinition>,
 ) -> QuickDbResult<HashMap<String, DataValue>> {
-    let mut map = HashMap::new();
+    let mut map = HashMap::with_capacity(row.columns().len());
 
     for column in row.columns() {
         let column_name = column.name();
@@ -139,7 +138,7 @@ pub fn row_to_data_map_with_metadata(
                                     FieldType::Integer { .. } => match s.parse::<i64>() {
                                         Ok(i) => DataValue::Int(i),
                                         Err(_) => {
-                                            debug!(
+                                            crate::debug_log!(
                                                 "Array字段 '{}' 整数转换失败: {}，保持字符串",
                                                 column_name, s
                                             );
@@ -149,7 +148,7 @@ pub fn row_to_data_map_with_metadata(
                                     FieldType::Float { .. } => match s.parse::<f64>() {
                                         Ok(f) => DataValue::Float(f),
                                         Err(_) => {
-                                            debug!(
+                                            crate::debug_log!(
                                                 "Array字段 '{}' 浮点数转换失败: {}，保持字符串",
                                                 column_name, s
                                             );
@@ -159,7 +158,7 @@ pub fn row_to_data_map_with_metadata(
                                     FieldType::Uuid => match s.parse::<uuid::Uuid>() {
                                         Ok(uuid) => DataValue::Uuid(uuid),
                                         Err(_) => {
-                                            debug!(
+                                            crate::debug_log!(
                                                 "Array字段 '{}' UUID转换失败: {}，保持字符串",
                                                 column_name, s
                                             );
@@ -167,7 +166,7 @@ pub fn row_to_data_map_with_metadata(
                                         }
                                     },
                                     _ => {
-                                        debug!(
+                                        crate::debug_log!(
                                             "Array字段 '{}' 不支持的item_type: {:?}，保持字符串",
                                             column_name, item_type
                                         );
@@ -179,7 +178,7 @@ pub fn row_to_data_map_with_metadata(
                         DataValue::Array(data_array)
                     }
                     Err(e) => {
-                        debug!(
+                        crate::debug_log!(
                             "Array字段 '{}' JSON解析失败: {}，返回原始字符串",
                             column_name, e
                         );
@@ -265,7 +264,17 @@ pub fn convert_rfc3339_to_local(rfc3339_str: &str) -> QuickDbResult<String> {
         }
     })?;
 
-    Ok(dt.format("%Y-%m-%d %H:%M:%S").to_string())
+    // 格式固定，直接按分量拼接，避免每次调用都重新解析strftime格式串
+    use chrono::{Datelike, Timelike};
+    Ok(format!(
+        "{:04}-{:02}-{:02} {:02}:{:02}:{:02}",
+        dt.year(),
+        dt.month(),
+        dt.day(),
+        dt.hour(),
+        dt.minute(),
+        dt.second()
+    ))
 }
 
 /// 对UTC时间应用时区偏移，返回本地时间
@@ -57,12 +57,14 @@ impl DatabaseAdapter for SqliteAdapter {
             // 再次检查表是否存在（双重检查锁定模式）
             if !self.table_exists(connection, table).await? {
                 // 尝试从模型管理器获取预定义的元数据
-                if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                     debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                     // 使用模型元数据创建表
                     self.create_table(connection, table, &model_meta.fields, id_strategy, alias)
                         .await?;
+                    // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                    crate::manager::invalidate_ensured_table(table, alias);
                     // 等待100ms确保数据库事务完全提交
                     tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
                     debug!("⏱️ 等待100ms确保表 '{}' 创建完成", table);
@@ -210,12 +212,14 @@ impl DatabaseAdapter for SqliteAdapter {
             // 再次检查表是否存在（双重检查锁定模式）
             if !self.table_exists(connection, table).await? {
                 // 尝试从模型管理器获取预定义的元数据
-                if let Some(model_meta) = crate::manager::get_model_with_alias(table, alias) {
+                if let Some(model_meta) = crate::manager::get_shared_model(table, alias) {
                     debug!("表 {} 不存在，使用预定义模型元数据创建", table);
 
                     // 使用模型元数据创建表
                     self.create_table(connection, table, &model_meta.fields, id_strategy, alias)
                         .await?;
+                    // 自动建表只创建表结构，不创建索引，需要让下次确认流程补建索引
+                    crate::manager::invalidate_ensured_table(table, alias);
                     // 等待100ms确保数据库事务完全提交
                     tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
                     debug!("⏱️ 等待100ms确保表 '{}' 创建完成", table);
@@ -410,7 +414,7 @@ impl DatabaseAdapter for SqliteAdapter {
             match row {
                 Some(r) => {
                     // 获取字段元数据
-                    let model_meta = crate::manager::get_model_with_alias(table, alias)
+                    let model_meta = crate::manager::get_shared_model(table, alias)
                         .ok_or_else(|| QuickDbError::ValidationError {
                             field: "model".to_string(),
                             message: format!("模型 '{}' 不存在", table),
@@ -535,14 +539,14 @@ impl DatabaseAdapter for SqliteAdapter {
 
             // 获取字段元数据
             let model_meta =
-                crate::manager::get_model_with_alias(table, alias).ok_or_else(|| {
+                crate::manager::get_shared_model(table, alias).ok_or_else(|| {
                     QuickDbError::ValidationError {
                         field: "model".to_string(),
                         message: format!("模型 '{}' 不存在", table),
                     }
                 })?;
 
-            let mut results = Vec::new();
+            let mut results = Vec::with_capacity(rows.len());
             for row in rows {
                 // 使用新的元数据转换函数
                 let data_map = super::data_conversion::row_to_data_map_with_metadata(
@@ -631,7 +635,7 @@ impl DatabaseAdapter for SqliteAdapter {
         {
             // 获取字段元数据进行验证和转换
             let model_meta =
-                crate::manager::get_model_with_alias(table, alias).ok_or_else(|| {
+                crate::manager::get_shared_model(table, alias).ok_or_else(|| {
                     QuickDbError::ValidationError {
                         field: "model".to_string(),
                         message: format!("模型 '{}' 不存在", table),
@@ -639,14 +643,9 @@ impl DatabaseAdapter for SqliteAdapter {
                 })?;
 
             // 使用timezone模块中的字段元数据处理函数进行验证和转换
-            let field_map: std::collections::HashMap<String, crate::model::FieldDefinition> =
-                model_meta
-                    .fields
-                    .iter()
-                    .map(|(name, f)| (name.clone(), f.clone()))
-                    .collect();
+            let field_map = &model_meta.fields;
             let validated_data =
-                crate::utils::timezone::process_data_fields_from_metadata(data.clone(), &field_map);
+                crate::utils::timezone::process_data_fields_from_metadata(data.clone(), field_map);
 
             let (sql, params) = SqlQueryBuilder::new()
                 .update(validated_data)
@@ -763,18 +762,13 @@ impl DatabaseAdapter for SqliteAdapter {
         };
 
         // 获取字段元数据进行验证和转换
-        let model_meta = crate::manager::get_model_with_alias(table, alias).ok_or_else(|| {
+        let model_meta = crate::manager::get_shared_model(table, alias).ok_or_else(|| {
             QuickDbError::ValidationError {
                 field: "model".to_string(),
                 message: format!("模型 '{}' 不存在", table),
             }
         })?;
-        let field_map: std::collections::HashMap<String, crate::model::FieldDefinition> =
-            model_meta
-                .fields
-                .iter()
-                .map(|(name, f)| (name.clone(), f.clone()))
-                .collect();
+        let field_map = &model_meta.fields;
 
         let mut set_clauses = Vec::new();
         let mut params = Vec::new();
@@ -790,7 +784,7 @@ impl DatabaseAdapter for SqliteAdapter {
                     operation_data.insert(operation.field.clone(), operation.value.clone());
                     let validated_data = crate::utils::timezone::process_data_fields_from_metadata(
                         operation_data,
-                        &field_map,
+                        field_map,
                     );
 
                     if let Some(converted_value) = validated_data.get(&operation.field) {
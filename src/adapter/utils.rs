@@ -16,7 +16,7 @@ pub fn get_field_type(
     field_name: &str,
 ) -> Option<crate::model::FieldType> {
     // 通过全局管理器使用别名获取模型元数据
-    if let Some(model_meta) = crate::manager::get_model_with_alias(table_name, alias) {
+    if let Some(model_meta) = crate::manager::get_shared_model(table_name, alias) {
         model_meta
             .fields
             .get(field_name)
@@ -8,6 +8,7 @@ use crate::types::{
     SortDirection,
 };
 use rat_logger::debug;
+use std::borrow::Cow;
 use std::vec::Vec;
 
 // 从 cache_manager.rs 中引入 CACHE_KEY_PREFIX 和 CacheManager
@@ -76,7 +77,9 @@ impl CacheManager {
     }
 
     /// 构建查询签名 - 高效版本，避免JSON序列化
-    fn build_query_signature(&self, options: &QueryOptions) -> String {
+    ///
+    /// 无分页/排序/投影的默认查询直接返回静态签名，不产生分配
+    fn build_query_signature(&self, options: &QueryOptions) -> Cow<'static, str> {
         let mut parts = Vec::new();
 
         // 分页信息
@@ -112,16 +115,16 @@ impl CacheManager {
 
         // 连接部分生成最终签名
         if parts.is_empty() {
-            "default".to_string()
+            Cow::Borrowed("default")
         } else {
-            parts.join("_")
+            Cow::Owned(parts.join("_"))
         }
     }
 
     /// 构建条件签名
-    fn build_conditions_signature(&self, conditions: &[QueryConditionWithConfig]) -> String {
+    fn build_conditions_signature(&self, conditions: &[QueryConditionWithConfig]) -> Cow<'static, str> {
         if conditions.is_empty() {
-            return "no_cond".to_string();
+            return Cow::Borrowed("no_cond");
         }
 
         let mut signature = String::new();
@@ -142,13 +145,13 @@ impl CacheManager {
                 }
             ));
         }
-        signature
+        Cow::Owned(signature)
     }
 
     /// 构建条件组合签名（完整版）
-    fn build_condition_groups_with_config_signature(&self, condition_groups: &[QueryConditionGroupWithConfig]) -> String {
+    fn build_condition_groups_with_config_signature(&self, condition_groups: &[QueryConditionGroupWithConfig]) -> Cow<'static, str> {
         if condition_groups.is_empty() {
-            return "no_groups".to_string();
+            return Cow::Borrowed("no_groups");
         }
 
         let mut signature = String::new();
@@ -205,13 +208,13 @@ impl CacheManager {
                 }
             }
         }
-        signature
+        Cow::Owned(signature)
     }
 
     /// 构建条件组合签名
-    fn build_condition_groups_signature(&self, condition_groups: &[QueryConditionGroup]) -> String {
+    fn build_condition_groups_signature(&self, condition_groups: &[QueryConditionGroup]) -> Cow<'static, str> {
         if condition_groups.is_empty() {
-            return "no_groups".to_string();
+            return Cow::Borrowed("no_groups");
         }
 
         let mut signature = String::new();
@@ -267,6 +270,6 @@ impl CacheManager {
                 }
             }
         }
-        signature
+        Cow::Owned(signature)
     }
 }
@@ -90,29 +90,38 @@ impl CacheManager {
         }
         debug!("开始清理匹配模式的缓存: pattern={}", pattern);
 
-        let mut cleared_count = 0;
-        let table_keys = self.table_keys.read().await;
+        // 只在读锁下收集匹配的键，删除期间不持有锁，避免阻塞 track_cache_key 等其他使用者
+        let matched = {
+            let table_keys = self.table_keys.read().await;
+
+            // 没有任何跟踪的缓存键时（如写入频繁但从未缓存过查询），无需逐键匹配
+            if table_keys.values().all(|keys| keys.is_empty()) {
+                debug!("没有跟踪的缓存键，跳过模式清理: pattern={}", pattern);
+                return Ok(0);
+            }
 
-        // 遍历所有跟踪的缓存键
-        for (table_name, keys) in table_keys.iter() {
-            let mut keys_to_remove = Vec::new();
-
-            for key in keys {
-                if self.matches_pattern(key, pattern) {
-                    if let Err(e) = self.cache.delete(key).await {
-                        warn!(
-                            "删除匹配模式的缓存键失败: key={}, pattern={}, error={}",
-                            key, pattern, e
-                        );
-                    } else {
-                        keys_to_remove.push(key.clone());
-                        cleared_count += 1;
-                        info!(
-                            "已删除匹配模式的缓存键: table={}, key={}, pattern={}",
-                            table_name, key, pattern
-                        );
-                    }
-                }
+            collect_matching_keys(&table_keys, pattern)
+        };
+
+        let cache = &self.cache;
+        let mut deleted_by_table = Vec::with_capacity(matched.len());
+        for (table_name, keys) in matched {
+            let deleted = delete_keys(keys, pattern, |key| async move {
+                cache.delete(&key).await.map(|_| ())
+            })
+            .await;
+            if !deleted.is_empty() {
+                deleted_by_table.push((table_name, deleted));
+            }
+        }
+
+        // 短暂持有写锁，只把删除成功的键移出跟踪列表；删除失败的键保留以便下次重试
+        let mut cleared_count = 0;
+        if !deleted_by_table.is_empty() {
+            let mut table_keys = self.table_keys.write().await;
+            for (table_name, deleted) in &deleted_by_table {
+                cleared_count += deleted.len();
+                untrack_keys(&mut table_keys, table_name, deleted);
             }
         }
 
@@ -333,60 +342,6 @@ impl CacheManager {
         Ok(cleared_count)
     }
 
-    /// 检查缓存键是否匹配模式
-    ///
-    /// 支持简单的通配符匹配：* 匹配任意字符序列，? 匹配单个字符
-    fn matches_pattern(&self, key: &str, pattern: &str) -> bool {
-        // 简单的通配符匹配实现
-        let pattern_chars: Vec<char> = pattern.chars().collect();
-        let key_chars: Vec<char> = key.chars().collect();
-
-        self.match_recursive(&key_chars, 0, &pattern_chars, 0)
-    }
-
-    /// 递归匹配算法
-    fn match_recursive(
-        &self,
-        key: &[char],
-        key_idx: usize,
-        pattern: &[char],
-        pattern_idx: usize,
-    ) -> bool {
-        // 如果模式已经匹配完
-        if pattern_idx >= pattern.len() {
-            return key_idx >= key.len();
-        }
-
-        // 如果键已经匹配完但模式还有非*字符
-        if key_idx >= key.len() {
-            return pattern[pattern_idx..].iter().all(|&c| c == '*');
-        }
-
-        match pattern[pattern_idx] {
-            '*' => {
-                // * 可以匹配0个或多个字符
-                // 尝试匹配0个字符（跳过*）
-                if self.match_recursive(key, key_idx, pattern, pattern_idx + 1) {
-                    return true;
-                }
-                // 尝试匹配1个或多个字符
-                self.match_recursive(key, key_idx + 1, pattern, pattern_idx)
-            }
-            '?' => {
-                // ? 匹配任意单个字符
-                self.match_recursive(key, key_idx + 1, pattern, pattern_idx + 1)
-            }
-            c => {
-                // 普通字符必须完全匹配
-                if key[key_idx] == c {
-                    self.match_recursive(key, key_idx + 1, pattern, pattern_idx + 1)
-                } else {
-                    false
-                }
-            }
-        }
-    }
-
     /// 获取缓存统计信息
     pub async fn get_stats(&self) -> Result<CacheStats> {
         if !self.config.enabled {
@@ -499,3 +454,176 @@ impl CacheManager {
         Ok(cached_count)
     }
 }
+
+/// 收集每个表中匹配模式的跟踪键
+fn collect_matching_keys(
+    table_keys: &HashMap<String, Vec<String>>,
+    pattern: &str,
+) -> Vec<(String, Vec<String>)> {
+    table_keys
+        .iter()
+        .filter_map(|(table_name, keys)| {
+            let matched: Vec<String> = keys
+                .iter()
+                .filter(|key| matches_pattern(key, pattern))
+                .cloned()
+                .collect();
+            (!matched.is_empty()).then(|| (table_name.clone(), matched))
+        })
+        .collect()
+}
+
+/// 逐个删除缓存键，返回删除成功的键
+async fn delete_keys<F, Fut, E>(keys: Vec<String>, pattern: &str, mut delete: F) -> Vec<String>
+where
+    F: FnMut(String) -> Fut,
+    Fut: std::future::Future<Output = std::result::Result<(), E>>,
+    E: std::fmt::Display,
+{
+    let mut deleted = Vec::with_capacity(keys.len());
+    for key in keys {
+        if let Err(e) = delete(key.clone()).await {
+            warn!(
+                "删除匹配模式的缓存键失败: key={}, pattern={}, error={}",
+                key, pattern, e
+            );
+        } else {
+            info!("已删除匹配模式的缓存键: key={}, pattern={}", key, pattern);
+            deleted.push(key);
+        }
+    }
+    deleted
+}
+
+/// 把已删除的键移出表的跟踪列表
+fn untrack_keys(table_keys: &mut HashMap<String, Vec<String>>, table: &str, deleted: &[String]) {
+    if let Some(keys) = table_keys.get_mut(table) {
+        let deleted: std::collections::HashSet<&str> = deleted.iter().map(String::as_str).collect();
+        keys.retain(|key| !deleted.contains(key.as_str()));
+    }
+}
+
+/// 检查缓存键是否匹配模式
+///
+/// 支持简单的通配符匹配：* 匹配任意字符序列，? 匹配单个字符
+fn matches_pattern(key: &str, pattern: &str) -> bool {
+    // 常见模式只在末尾有一个 *（如 "rat_quickdb:users:query:*"），直接按前缀比较
+    if let Some(prefix) = pattern.strip_suffix('*') {
+        if !prefix.contains(['*', '?']) {
+            return key.starts_with(prefix);
+        }
+    }
+
+    // 简单的通配符匹配实现
+    let pattern_chars: Vec<char> = pattern.chars().collect();
+    let key_chars: Vec<char> = key.chars().collect();
+
+    match_recursive(&key_chars, 0, &pattern_chars, 0)
+}
+
+/// 递归匹配算法
+fn match_recursive(
+    key: &[char],
+    key_idx: usize,
+    pattern: &[char],
+    pattern_idx: usize,
+) -> bool {
+    // 如果模式已经匹配完
+    if pattern_idx >= pattern.len() {
+        return key_idx >= key.len();
+    }
+
+    // 如果键已经匹配完但模式还有非*字符
+    if key_idx >= key.len() {
+        return pattern[pattern_idx..].iter().all(|&c| c == '*');
+    }
+
+    match pattern[pattern_idx] {
+        '*' => {
+            // * 可以匹配0个或多个字符
+            // 尝试匹配0个字符（跳过*）
+            if match_recursive(key, key_idx, pattern, pattern_idx + 1) {
+                return true;
+            }
+            // 尝试匹配1个或多个字符
+            match_recursive(key, key_idx + 1, pattern, pattern_idx)
+        }
+        '?' => {
+            // ? 匹配任意单个字符
+            match_recursive(key, key_idx + 1, pattern, pattern_idx + 1)
+        }
+        c => {
+            // 普通字符必须完全匹配
+            if key[key_idx] == c {
+                match_recursive(key, key_idx + 1, pattern, pattern_idx + 1)
+            } else {
+                false
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_matches_pattern_trailing_wildcard() {
+        assert!(matches_pattern("rat_quickdb:users:query:abc", "rat_quickdb:users:query:*"));
+        assert!(matches_pattern("rat_quickdb:users:query:", "rat_quickdb:users:query:*"));
+        assert!(!matches_pattern("rat_quickdb:orders:query:abc", "rat_quickdb:users:query:*"));
+    }
+
+    #[test]
+    fn test_matches_pattern_inner_wildcards() {
+        assert!(matches_pattern("rat_quickdb:users:record:1", "rat_quickdb:*:record:*"));
+        assert!(!matches_pattern("rat_quickdb:users:query:1", "rat_quickdb:*:record:*"));
+        assert!(matches_pattern("user:1:profile", "user:?:profile"));
+        assert!(!matches_pattern("user:12:profile", "user:?:profile"));
+        assert!(matches_pattern("user:12:profile", "user:*:pro?ile"));
+    }
+
+    #[test]
+    fn test_matches_pattern_exact() {
+        assert!(matches_pattern("rat_quickdb:users", "rat_quickdb:users"));
+        assert!(!matches_pattern("rat_quickdb:users:1", "rat_quickdb:users"));
+        assert!(!matches_pattern("rat_quickdb:user", "rat_quickdb:users"));
+    }
+
+    #[tokio::test]
+    async fn test_clear_flow_keeps_failed_and_unmatched() {
+        let mut table_keys = HashMap::new();
+        table_keys.insert(
+            "users".to_string(),
+            vec![
+                "users:query:1".to_string(),
+                "users:query:fail".to_string(),
+                "users:record:1".to_string(),
+                "users:query:2".to_string(),
+            ],
+        );
+        table_keys.insert("orders".to_string(), vec!["orders:record:1".to_string()]);
+
+        let matched = collect_matching_keys(&table_keys, "users:query:*");
+        assert_eq!(matched.len(), 1);
+
+        let (table_name, keys) = matched.into_iter().next().unwrap();
+        let deleted = delete_keys(keys, "users:query:*", |key| async move {
+            if key.ends_with("fail") {
+                Err("delete failed")
+            } else {
+                Ok(())
+            }
+        })
+        .await;
+        assert_eq!(deleted, vec!["users:query:1".to_string(), "users:query:2".to_string()]);
+
+        // 删除成功的键移出跟踪；删除失败和不匹配的键保留，便于下次重试
+        untrack_keys(&mut table_keys, &table_name, &deleted);
+        assert_eq!(
+            table_keys["users"],
+            vec!["users:query:fail".to_string(), "users:record:1".to_string()]
+        );
+        assert_eq!(table_keys["orders"], vec!["orders:record:1".to_string()]);
+    }
+}
@@ -8,6 +8,7 @@ use anyhow::{Result, anyhow};
 use bytes::Bytes;
 use rat_logger::{debug, warn};
 use rat_memcache::{CacheOptions, RatMemCache};
+use serde::{Serialize, Serializer};
 use serde_json;
 use std::sync::atomic::Ordering;
 use std::time::Instant;
@@ -50,83 +51,7 @@ impl CacheManager {
             return Ok(());
         }
 
-        // 修复：正确序列化所有类型的DataValue
-        let json_results: Vec<serde_json::Value> = results
-            .iter()
-            .map(|dv| {
-                match dv {
-                    DataValue::Json(json_val) => json_val.clone(),
-                    DataValue::String(s) => serde_json::Value::String(s.clone()),
-                    DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                    DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                    DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                    DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                    DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::Null => serde_json::Value::Null,
-                    DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                    DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                    DataValue::Array(arr) => {
-                        let json_array: Vec<serde_json::Value> = arr.iter().map(|item| {
-                            // 递归处理数组元素
-                            match item {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                                DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                                DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                                _ => serde_json::Value::String(format!("{:?}", item)), // 其他复杂类型转为字符串
-                            }
-                        }).collect();
-                        serde_json::Value::Array(json_array)
-                    }
-                    DataValue::Vector(vec) => {
-                        serde_json::Value::Array(vec.iter().map(|v| {
-                            serde_json::Number::from_f64(*v as f64)
-                                .map(serde_json::Value::Number)
-                                .unwrap_or(serde_json::Value::Null)
-                        }).collect())
-                    }
-                    DataValue::Object(obj) => {
-                        let mut json_obj = serde_json::Map::new();
-                        for (key, value) in obj {
-                            let json_value = match value {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                              DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => {
-                                    serde_json::Value::String(dt.to_rfc3339())
-                                }
-                                DataValue::DateTimeUTC(dt) => {
-                                    serde_json::Value::String(dt.to_rfc3339())
-                                }
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => {
-                                    serde_json::Value::String(base64::encode(bytes))
-                                }
-                                DataValue::Uuid(uuid) => {
-                                    serde_json::Value::String(uuid.to_string())
-                                }
-                                _ => serde_json::Value::String(format!("{:?}", value)), // 其他复杂类型转为字符串
-                            };
-                            json_obj.insert(key.clone(), json_value);
-                        }
-                        serde_json::Value::Object(json_obj)
-                    }
-                }
-            })
-            .collect();
-
-        let serialized = serde_json::to_vec(&json_results)
+        let serialized = serialize_results_for_cache(results)
             .map_err(|e| anyhow!("Failed to serialize query results: {}", e))?;
 
         let cache_options = CacheOptions {
@@ -189,82 +114,7 @@ impl CacheManager {
             return Ok(());
         }
 
-        // 将所有DataValue转换为JSON值进行序列化
-        let json_results: Vec<serde_json::Value> = results
-            .iter()
-            .map(|dv| {
-                match dv {
-                    DataValue::Json(json_val) => json_val.clone(),
-                    DataValue::String(s) => serde_json::Value::String(s.clone()),
-                    DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                    DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                    DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                    DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                    DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::Null => serde_json::Value::Null,
-                    DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                    DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                    DataValue::Array(arr) => {
-                        let json_array: Vec<serde_json::Value> = arr.iter().map(|item| {
-                            match item {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                                DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                                DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                                _ => serde_json::Value::String(format!("{:?}", item)), // 其他复杂类型转为字符串
-                            }
-                        }).collect();
-                        serde_json::Value::Array(json_array)
-                    }
-                    DataValue::Vector(vec) => {
-                        serde_json::Value::Array(vec.iter().map(|v| {
-                            serde_json::Number::from_f64(*v as f64)
-                                .map(serde_json::Value::Number)
-                                .unwrap_or(serde_json::Value::Null)
-                        }).collect())
-                    }
-                    DataValue::Object(obj) => {
-                        let mut json_obj = serde_json::Map::new();
-                        for (key, value) in obj {
-                            let json_value = match value {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                              DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => {
-                                    serde_json::Value::String(dt.to_rfc3339())
-                                }
-                                DataValue::DateTimeUTC(dt) => {
-                                    serde_json::Value::String(dt.to_rfc3339())
-                                }
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => {
-                                    serde_json::Value::String(base64::encode(bytes))
-                                }
-                                DataValue::Uuid(uuid) => {
-                                    serde_json::Value::String(uuid.to_string())
-                                }
-                                _ => serde_json::Value::String(format!("{:?}", value)), // 其他复杂类型转为字符串
-                            };
-                            json_obj.insert(key.clone(), json_value);
-                        }
-                        serde_json::Value::Object(json_obj)
-                    }
-                }
-            })
-            .collect();
-
-        let serialized = serde_json::to_vec(&json_results)
+        let serialized = serialize_results_for_cache(results)
             .map_err(|e| anyhow!("Failed to serialize condition groups query results: {}", e))?;
 
         let cache_options = CacheOptions {
@@ -364,6 +214,19 @@ impl CacheManager {
         self.get_cached_result_by_key(&key, table, start_time).await
     }
 
+    /// 使用已生成的缓存键获取查询结果
+    pub(crate) async fn get_cached_result_with_key(
+        &self,
+        table: &str,
+        key: &str,
+    ) -> Result<Option<Vec<DataValue>>> {
+        if !self.config.enabled {
+            return Ok(None);
+        }
+
+        self.get_cached_result_by_key(key, table, Instant::now()).await
+    }
+
     /// 缓存条件组合查询结果（完整版）
     pub async fn cache_condition_groups_with_config_result(
         &self,
@@ -376,8 +239,24 @@ impl CacheManager {
             return Ok(());
         }
 
-        let start_time = Instant::now();
         let key = self.generate_condition_groups_with_config_cache_key(table, condition_groups, options);
+        self.cache_result_with_key(table, &key, results).await
+    }
+
+    /// 使用已生成的缓存键缓存条件组合查询结果
+    ///
+    /// 供已经持有缓存键的调用方使用，避免读取和写入缓存时重复生成同一个键
+    pub(crate) async fn cache_result_with_key(
+        &self,
+        table: &str,
+        key: &str,
+        results: &[DataValue],
+    ) -> Result<()> {
+        if !self.config.enabled {
+            return Ok(());
+        }
+
+        let start_time = Instant::now();
 
         debug!(
             "开始缓存条件组合查询结果（完整版）: table={}, key={}, count={}",
@@ -392,74 +271,7 @@ impl CacheManager {
             return Ok(());
         }
 
-        // 将所有DataValue转换为JSON值进行序列化
-        let json_results: Vec<serde_json::Value> = results
-            .iter()
-            .map(|dv| {
-                match dv {
-                    DataValue::Json(json_val) => json_val.clone(),
-                    DataValue::String(s) => serde_json::Value::String(s.clone()),
-                    DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                    DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                    DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                    DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                    DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                    DataValue::Null => serde_json::Value::Null,
-                    DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                    DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                    DataValue::Array(arr) => {
-                        let json_array: Vec<serde_json::Value> = arr.iter().map(|item| {
-                            match item {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                                DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                                DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                                _ => serde_json::Value::String(format!("{:?}", item)),
-                            }
-                        }).collect();
-                        serde_json::Value::Array(json_array)
-                    }
-                    DataValue::Vector(vec) => {
-                        serde_json::Value::Array(vec.iter().map(|v| {
-                            serde_json::Number::from_f64(*v as f64)
-                                .map(serde_json::Value::Number)
-                                .unwrap_or(serde_json::Value::Null)
-                        }).collect())
-                    }
-                    DataValue::Object(obj) => {
-                        let mut json_obj = serde_json::Map::new();
-                        for (key, value) in obj {
-                            let json_value = match value {
-                                DataValue::Json(json_val) => json_val.clone(),
-                                DataValue::String(s) => serde_json::Value::String(s.clone()),
-                                DataValue::Int(i) => serde_json::Value::Number(serde_json::Number::from(*i)),
-                                DataValue::UInt(u) => serde_json::Value::Number(serde_json::Number::from(*u)),
-                                DataValue::Float(f) => serde_json::Value::Number(serde_json::Number::from_f64(*f).unwrap_or(serde_json::Number::from(0))),
-                                DataValue::Bool(b) => serde_json::Value::Bool(*b),
-                                DataValue::DateTime(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::DateTimeUTC(dt) => serde_json::Value::String(dt.to_rfc3339()),
-                                DataValue::Null => serde_json::Value::Null,
-                                DataValue::Bytes(bytes) => serde_json::Value::String(base64::encode(bytes)),
-                                DataValue::Uuid(uuid) => serde_json::Value::String(uuid.to_string()),
-                                _ => serde_json::Value::String(format!("{:?}", value)),
-                            };
-                            json_obj.insert(key.clone(), json_value);
-                        }
-                        serde_json::Value::Object(json_obj)
-                    }
-                }
-            })
-            .collect();
-
-        let serialized = serde_json::to_vec(&json_results)
+        let serialized = serialize_results_for_cache(results)
             .map_err(|e| anyhow!("Failed to serialize condition groups query results: {}", e))?;
 
         let cache_options = CacheOptions {
@@ -468,12 +280,12 @@ impl CacheManager {
         };
 
         self.cache
-            .set_with_options(key.clone(), Bytes::from(serialized), &cache_options)
+            .set_with_options(key.to_string(), Bytes::from(serialized), &cache_options)
             .await
             .map_err(|e| anyhow!("Failed to cache condition groups query results: {}", e))?;
 
         // 记录缓存键
-        self.track_cache_key(table, key.clone()).await;
+        self.track_cache_key(table, key.to_string()).await;
 
         // 更新统计信息
         let elapsed = start_time.elapsed();
@@ -654,3 +466,97 @@ impl CacheManager {
         }
     }
 }
+
+/// 查询结果的缓存序列化视图
+///
+/// 直接从借用的DataValue写出JSON字节，避免先克隆出一整棵serde_json::Value中间树。
+/// 嵌套层级中的复杂类型（数组/对象/向量）保持原有行为，转为字符串存储。
+struct CachedValue<'a> {
+    value: &'a DataValue,
+    nested: bool,
+}
+
+impl Serialize for CachedValue<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> std::result::Result<S::Ok, S::Error> {
+        match self.value {
+            DataValue::Json(json_val) => json_val.serialize(serializer),
+            DataValue::String(s) => serializer.serialize_str(s),
+            DataValue::Int(i) => serializer.serialize_i64(*i),
+            DataValue::UInt(u) => serializer.serialize_u64(*u),
+            DataValue::Float(f) => {
+                if f.is_finite() {
+                    serializer.serialize_f64(*f)
+                } else {
+                    serializer.serialize_i64(0)
+                }
+            }
+            DataValue::Bool(b) => serializer.serialize_bool(*b),
+            DataValue::DateTime(dt) => serializer.serialize_str(&dt.to_rfc3339()),
+            DataValue::DateTimeUTC(dt) => serializer.serialize_str(&dt.to_rfc3339()),
+            DataValue::Null => serializer.serialize_unit(),
+            DataValue::Bytes(bytes) => serializer.serialize_str(&base64::encode(bytes)),
+            DataValue::Uuid(uuid) => serializer.collect_str(uuid),
+            // 其他复杂类型转为字符串
+            _ if self.nested => serializer.collect_str(self.value),
+            DataValue::Array(arr) => serializer.collect_seq(arr.iter().map(|item| CachedValue {
+                value: item,
+                nested: true,
+            })),
+            DataValue::Object(obj) => serializer.collect_map(obj.iter().map(|(key, value)| {
+                (
+                    key,
+                    CachedValue {
+                        value,
+                        nested: true,
+                    },
+                )
+            })),
+            DataValue::Vector(vec) => serializer.collect_seq(vec.iter().map(|v| {
+                let f = *v as f64;
+                if f.is_finite() { Some(f) } else { None }
+            })),
+        }
+    }
+}
+
+/// 将查询结果序列化为缓存字节
+fn serialize_results_for_cache(results: &[DataValue]) -> serde_json::Result<Vec<u8>> {
+    let mut serializer = serde_json::Serializer::new(Vec::new());
+    (&mut serializer).collect_seq(results.iter().map(|value| CachedValue {
+        value,
+        nested: false,
+    }))?;
+    Ok(serializer.into_inner())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::collections::HashMap;
+
+    #[test]
+    fn test_serialize_results_for_cache() {
+        let mut obj = HashMap::new();
+        obj.insert("name".to_string(), DataValue::String("alice".to_string()));
+        obj.insert("tags".to_string(), DataValue::Array(vec![DataValue::Int(1)]));
+
+        let results = vec![
+            DataValue::Object(obj),
+            DataValue::Float(f64::NAN),
+            DataValue::Array(vec![DataValue::Bool(true), DataValue::Null]),
+            DataValue::Vector(vec![0.5, f32::INFINITY]),
+        ];
+
+        let bytes = serialize_results_for_cache(&results).unwrap();
+        let parsed: serde_json::Value = serde_json::from_slice(&bytes).unwrap();
+        assert_eq!(
+            parsed,
+            serde_json::json!([
+                {"name": "alice", "tags": "[1]"},
+                0,
+                [true, null],
+                [0.5, null]
+            ])
+        );
+    }
+}
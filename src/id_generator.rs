@@ -120,10 +120,10 @@ struct SnowflakeGenerator {
     machine_id: u16,
     /// 数据中心 ID（5 位）
     datacenter_id: u8,
-    /// 序列号（12 位）
-    sequence: Arc<AtomicU64>,
-    /// 上次时间戳
-    last_timestamp: Arc<AtomicU64>,
+    /// 上次时间戳与序列号的打包状态（高位为毫秒时间戳，低 12 位为序列号）
+    ///
+    /// 两者放在同一个原子量里，用一次 CAS 同时更新，避免并发生成时出现重复 ID
+    state: AtomicU64,
 }
 
 impl SnowflakeGenerator {
@@ -139,34 +139,48 @@ impl SnowflakeGenerator {
         Ok(Self {
             machine_id,
             datacenter_id,
-            sequence: Arc::new(AtomicU64::new(0)),
-            last_timestamp: Arc::new(AtomicU64::new(0)),
+            state: AtomicU64::new(0),
         })
     }
 
     /// 生成雪花算法 ID
     async fn generate(&self) -> Result<u64> {
-        let mut timestamp = self.current_timestamp();
-        let last_timestamp = self.last_timestamp.load(Ordering::SeqCst);
-
-        if timestamp < last_timestamp {
-            return Err(anyhow!("Clock moved backwards"));
-        }
+        let (timestamp, sequence) = loop {
+            let state = self.state.load(Ordering::SeqCst);
+            let last_timestamp = state >> 12;
+            let last_sequence = state & 0xFFF;
+            let now = self.current_timestamp();
+
+            if now < last_timestamp {
+                return Err(anyhow!("Clock moved backwards"));
+            }
 
-        let sequence = if timestamp == last_timestamp {
-            let seq = self.sequence.fetch_add(1, Ordering::SeqCst) & 0xFFF;
-            if seq == 0 {
-                // 序列号溢出，等待下一毫秒
-                timestamp = self.wait_next_millis(last_timestamp);
+            let (timestamp, sequence) = if now == last_timestamp {
+                if last_sequence == 0xFFF {
+                    // 序列号溢出，等待下一毫秒
+                    (self.wait_next_millis(last_timestamp), 0)
+                } else {
+                    (now, last_sequence + 1)
+                }
+            } else {
+                (now, 0)
+            };
+
+            // 只有状态未被其他调用者修改时才提交，否则重新读取后重试
+            if self
+                .state
+                .compare_exchange(
+                    state,
+                    (timestamp << 12) | sequence,
+                    Ordering::SeqCst,
+                    Ordering::SeqCst,
+                )
+                .is_ok()
+            {
+                break (timestamp, sequence);
             }
-            seq
-        } else {
-            self.sequence.store(0, Ordering::SeqCst);
-            0
         };
 
-        self.last_timestamp.store(timestamp, Ordering::SeqCst);
-
         // 组装雪花算法 ID
         // 时间戳（41位） + 数据中心ID（5位） + 机器ID（10位） + 序列号（12位）
         let id = ((timestamp - 1288834974657) << 22)
@@ -300,6 +314,39 @@ mod tests {
         }
     }
 
+    #[tokio::test(flavor = "multi_thread", worker_threads = 4)]
+    async fn test_snowflake_generator_concurrent_unique() {
+        let generator = IdGenerator::new(IdStrategy::Snowflake {
+            machine_id: 1,
+            datacenter_id: 1,
+        })
+        .unwrap();
+
+        // 模拟并发分发的创建请求，所有 ID 必须唯一
+        let mut handles = Vec::new();
+        for _ in 0..8 {
+            let generator = generator.clone();
+            handles.push(tokio::spawn(async move {
+                let mut ids = Vec::with_capacity(2000);
+                for _ in 0..2000 {
+                    ids.push(generator.generate().await.unwrap());
+                }
+                ids
+            }));
+        }
+
+        let mut seen = std::collections::HashSet::new();
+        for handle in handles {
+            for id in handle.await.unwrap() {
+                match id {
+                    IdType::String(s) => assert!(seen.insert(s), "duplicate snowflake id"),
+                    _ => panic!("Expected string IDs"),
+                }
+            }
+        }
+        assert_eq!(seen.len(), 8 * 2000);
+    }
+
     #[tokio::test]
     async fn test_object_id_generator() {
         let generator = IdGenerator::new(IdStrategy::ObjectId).unwrap();
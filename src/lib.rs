@@ -42,8 +42,8 @@ pub mod stored_procedure;
 // 重新导出常用类型和函数
 pub use error::{QuickDbError, QuickDbResult};
 pub use manager::{
-    add_database, drop_table, get_aliases, health_check, register_model, set_default_alias,
-    table_exists,
+    add_database, drop_table, get_aliases, health_check, register_model, register_models,
+    set_default_alias, table_exists,
 };
 pub use pool::DatabaseConnection;
 pub use types::*;
@@ -175,145 +175,14 @@ pub fn generate_object_id() -> String {
 ///
 /// # 返回值
 /// 返回处理后的数据映射，其中复杂字段被正确转换
-/// 对UTC时间应用时区偏移，返回本地时间
 ///
-/// # 参数
-/// - `utc_dt`: UTC时间（FixedOffset格式，通常为+00:00）
-/// - `timezone_offset`: 时区偏移，格式 "+08:00", "-05:00"
-///
-/// # 返回
-/// 本地时间（带时区信息）
-fn apply_timezone_offset_to_datetime(
-    utc_dt: chrono::DateTime<chrono::FixedOffset>,
-    timezone_offset: &str,
-) -> QuickDbResult<chrono::DateTime<chrono::FixedOffset>> {
-    let offset_seconds = crate::utils::timezone::parse_timezone_offset_to_seconds(timezone_offset)?;
-
-    // 检查时区偏移是否在有效范围内（-23:59 到 +23:59）
-    if offset_seconds < -86399 || offset_seconds > 86399 {
-        return Err(QuickDbError::ValidationError {
-            field: "timezone_offset".to_string(),
-            message: format!(
-                "时区偏移超出有效范围: {}, 允许范围: -23:59 到 +23:59",
-                timezone_offset
-            ),
-        });
-    }
-
-    // 将UTC时间转换为本地时间
-    let utc_chrono = utc_dt.with_timezone(&chrono::Utc);
-    let local_dt = utc_chrono.with_timezone(&chrono::FixedOffset::east(offset_seconds));
-
-    Ok(local_dt)
-}
-
+/// 与 `utils::timezone::process_data_fields_from_metadata` 不同，此函数保持
+/// DateTimeWithTz 字段的 String / DateTimeUTC 值不变
 pub fn process_data_fields_from_metadata(
-    mut data_map: std::collections::HashMap<String, DataValue>,
+    data_map: std::collections::HashMap<String, DataValue>,
     fields: &std::collections::HashMap<String, crate::model::FieldDefinition>,
 ) -> std::collections::HashMap<String, DataValue> {
-    for (field_name, field_def) in fields {
-        if let Some(current_value) = data_map.get::<str>(field_name) {
-            let converted_value = match current_value {
-                // 处理字符串类型的JSON数据
-                DataValue::String(json_str)
-                    if json_str.starts_with('[') || json_str.starts_with('{') =>
-                {
-                    // 尝试解析JSON
-                    match serde_json::from_str::<serde_json::Value>(json_str.as_str()) {
-                        Ok(json_value) => {
-                            let converted =
-                                crate::types::data_value::json_value_to_data_value(json_value);
-                            debug_log!(
-                                "字段 {} JSON转换成功: {:?} -> {:?}",
-                                field_name,
-                                json_str,
-                                converted
-                            );
-                            Some(converted)
-                        }
-                        Err(e) => {
-                            debug_log!(
-                                "字段 {} JSON解析失败，保持原字符串: {} (错误: {})",
-                                field_name,
-                                json_str,
-                                e
-                            );
-                            None // 解析失败，保持原字符串值
-                        }
-                    }
-                }
-                // 处理布尔字段的整数转换（SQLite等数据库的兼容性）
-                DataValue::Int(int_val)
-                    if matches!(field_def.field_type, crate::model::FieldType::Boolean) =>
-                {
-                    if *int_val == 0 || *int_val == 1 {
-                        debug_log!(
-                            "字段 {} 整数转布尔: {} -> {}",
-                            field_name,
-                            int_val,
-                            *int_val == 1
-                        );
-                        Some(DataValue::Bool(*int_val == 1))
-                    } else {
-                        debug_log!(
-                            "字段 {} 整数值超出布尔范围: {}，保持原值",
-                            field_name,
-                            int_val
-                        );
-                        None
-                    }
-                }
-                // 处理DateTimeWithTz字段的时区转换
-                DataValue::DateTime(dt)
-                    if matches!(
-                        field_def.field_type,
-                        crate::model::FieldType::DateTimeWithTz { .. }
-                    ) =>
-                {
-                    if let crate::model::FieldType::DateTimeWithTz { timezone_offset } =
-                        &field_def.field_type
-                    {
-                        debug_log!(
-                            "字段 {} DateTimeWithTz时区转换: {} -> 时区 {}",
-                            field_name,
-                            dt,
-                            timezone_offset
-                        );
-                        // 应用时区偏移转换
-                        match apply_timezone_offset_to_datetime(*dt, timezone_offset) {
-                            Ok(local_dt) => {
-                                debug_log!(
-                                    "字段 {} 时区转换成功: {} -> {}",
-                                    field_name,
-                                    dt,
-                                    local_dt
-                                );
-                                Some(DataValue::DateTime(local_dt))
-                            }
-                            Err(e) => {
-                                debug_log!(
-                                    "字段 {} 时区转换失败: {} (错误: {})",
-                                    field_name,
-                                    dt,
-                                    e
-                                );
-                                None // 转换失败，保持原值
-                            }
-                        }
-                    } else {
-                        None
-                    }
-                }
-                _ => None, // 其他类型保持不变
-            };
-
-            // 如果有转换结果，更新数据映射
-            if let Some(converted) = converted_value {
-                data_map.insert(field_name.clone(), converted);
-            }
-        }
-    }
-    data_map
+    crate::utils::timezone::convert_fields_from_metadata(data_map, fields, false)
 }
 
 /// 初始化rat_quickdb库
@@ -30,7 +30,7 @@ pub struct PoolManager {
     /// 缓存管理器映射 (别名 -> 缓存管理器)
     pub(crate) cache_managers: Arc<DashMap<String, Arc<CacheManager>>>,
     /// 模型元数据注册表 (集合名 -> 模型元数据)
-    pub(crate) model_registry: Arc<DashMap<String, ModelMeta>>,
+    pub(crate) model_registry: Arc<DashMap<String, Arc<ModelMeta>>>,
     /// 索引创建锁，防止并发创建同一个索引 (表名 -> 索引名 -> ())
     pub(crate) index_creation_locks: Arc<tokio::sync::Mutex<HashMap<String, HashMap<String, ()>>>>,
 }
@@ -106,6 +106,13 @@ pub fn register_model(model_meta: ModelMeta) -> QuickDbResult<()> {
     get_global_pool_manager().register_model(model_meta)
 }
 
+/// 便捷函数 - 批量注册模型元数据
+///
+/// 只需一次调用即可注册全部模型；先校验整批元数据，任一无效时返回带序号的错误且不注册任何模型
+pub fn register_models(model_metas: Vec<ModelMeta>) -> QuickDbResult<()> {
+    get_global_pool_manager().register_models(model_metas)
+}
+
 /// 便捷函数 - 获取模型元数据
 #[deprecated(note = "使用 get_model(collection_name, alias) 替代")]
 pub fn get_model(collection_name: &str) -> Option<ModelMeta> {
@@ -117,6 +124,18 @@ pub fn get_model_with_alias(collection_name: &str, alias: &str) -> Option<ModelM
     get_global_pool_manager().get_model_with_alias(collection_name, alias)
 }
 
+/// 便捷函数 - 获取带别名的模型元数据（共享引用，供适配器热路径使用）
+pub(crate) fn get_shared_model(collection_name: &str, alias: &str) -> Option<Arc<ModelMeta>> {
+    get_global_pool_manager().get_shared_model(collection_name, alias)
+}
+
+/// 便捷函数 - 使表的就绪记录失效（适配器自动建表时调用，该路径只建表不建索引）
+pub(crate) fn invalidate_ensured_table(collection_name: &str, alias: &str) {
+    if let Some(pool) = get_global_pool_manager().pools.get(alias) {
+        pool.ensured_tables.invalidate(collection_name);
+    }
+}
+
 /// 便捷函数 - 检查模型是否已注册
 pub fn has_model(collection_name: &str) -> bool {
     get_global_pool_manager().has_model(collection_name)
@@ -26,36 +26,91 @@ impl PoolManager {
             .unwrap_or_else(|| "default".to_string());
         let registry_key = format!("{}:{}", database_alias, collection_name);
 
-        // 检查是否已注册
-        if self.model_registry.contains_key(&registry_key) {
+        // 检查是否已注册；元数据完全相同时直接跳过，保留已确认的表和索引状态
+        if let Some(existing) = self.model_registry.get(&registry_key) {
+            if existing.value().as_ref() == &model_meta {
+                debug!("模型元数据未变化，跳过重复注册: {}", registry_key);
+                return Ok(());
+            }
             debug!("模型已存在，将更新元数据: {}", registry_key);
         }
 
-        self.model_registry
-            .insert(registry_key.clone(), model_meta.clone());
+        let index_count = model_meta.indexes.len();
+        self.model_registry.insert(registry_key, Arc::new(model_meta));
+
+        // 元数据可能已变化（如新增索引），需要重新确认表和索引
+        if let Some(pool) = self.pools.get(&database_alias) {
+            pool.ensured_tables.invalidate(&collection_name);
+        }
         debug!(
             "注册模型元数据: 数据库={}, 集合={}, 索引数量={}",
             database_alias,
             collection_name,
-            model_meta.indexes.len()
+            index_count
         );
 
         Ok(())
     }
 
+    /// 批量注册模型元数据
+    ///
+    /// 一次调用注册多个模型。注册前先校验全部元数据（集合名不能为空），
+    /// 任一元数据无效时返回带序号的错误，整批都不注册。
+    /// 单个注册的 `register_model` 不做此校验，行为保持不变
+    pub fn register_models(&self, model_metas: Vec<ModelMeta>) -> QuickDbResult<()> {
+        for (index, model_meta) in model_metas.iter().enumerate() {
+            Self::validate_model_meta(model_meta).map_err(|e| match e {
+                QuickDbError::ValidationError { field, message } => QuickDbError::ValidationError {
+                    field,
+                    message: format!("第{}个模型元数据无效: {}", index, message),
+                },
+                other => other,
+            })?;
+        }
+
+        // 校验已在上面完成；register_model 本身不做校验也不会失败，整批要么全部注册要么都不注册
+        let count = model_metas.len();
+        for model_meta in model_metas {
+            self.register_model(model_meta)?;
+        }
+        debug!("批量注册模型元数据完成: 数量={}", count);
+        Ok(())
+    }
+
+    /// 校验批量注册的模型元数据
+    fn validate_model_meta(model_meta: &ModelMeta) -> QuickDbResult<()> {
+        if model_meta.collection_name.trim().is_empty() {
+            return Err(QuickDbError::ValidationError {
+                field: "collection_name".to_string(),
+                message: "模型集合名不能为空".to_string(),
+            });
+        }
+        Ok(())
+    }
+
     /// 获取模型元数据
     pub fn get_model(&self, collection_name: &str) -> Option<ModelMeta> {
         self.model_registry
             .get(collection_name)
-            .map(|meta| meta.clone())
+            .map(|meta| meta.as_ref().clone())
     }
 
     /// 获取指定数据库的模型元数据
     pub fn get_model_with_alias(&self, collection_name: &str, alias: &str) -> Option<ModelMeta> {
+        self.get_shared_model(collection_name, alias)
+            .map(|meta| meta.as_ref().clone())
+    }
+
+    /// 获取指定数据库的模型元数据（共享引用，不复制字段定义）
+    pub(crate) fn get_shared_model(
+        &self,
+        collection_name: &str,
+        alias: &str,
+    ) -> Option<Arc<ModelMeta>> {
         let registry_key = format!("{}:{}", alias, collection_name);
         self.model_registry
             .get(&registry_key)
-            .map(|meta| meta.clone())
+            .map(|meta| meta.value().clone())
     }
 
     /// 检查模型是否已注册
@@ -67,7 +122,7 @@ impl PoolManager {
     pub fn get_registered_models(&self) -> Vec<(String, ModelMeta)> {
         self.model_registry
             .iter()
-            .map(|entry| (entry.key().clone(), entry.value().clone()))
+            .map(|entry| (entry.key().clone(), entry.value().as_ref().clone()))
             .collect()
     }
 
@@ -111,27 +166,31 @@ impl PoolManager {
         collection_name: &str,
         alias: &str,
     ) -> QuickDbResult<()> {
-        if let Some(model_meta) = self.get_model_with_alias(collection_name, alias) {
+        if let Some(model_meta) = self.get_shared_model(collection_name, alias) {
             debug!("为集合 {} 创建表和索引", collection_name);
 
             // 获取连接池
             if let Some(pool) = self.pools.get(alias) {
-                // 创建表（如果不存在）
-                let fields: HashMap<String, crate::model::FieldDefinition> = model_meta
-                    .fields
-                    .iter()
-                    .map(|(name, field_def)| (name.clone(), field_def.clone()))
-                    .collect();
-
-                // 检查表是否存在
+                // 已确认过表和索引就绪，跳过表存在性检查和逐个索引创建的数据库往返
+                if pool.ensured_tables.contains(collection_name) {
+                    return Ok(());
+                }
+                let ensure_generation = pool.ensured_tables.begin();
+
+                // 检查表是否存在，不存在时直接借用注册的字段定义创建表
                 let table_exists = pool.table_exists(&collection_name).await?;
                 if !table_exists {
                     debug!("表 {} 不存在，正在创建", collection_name);
-                    pool.create_table(&collection_name, &fields, &pool.db_config.id_strategy)
-                        .await?;
+                    pool.create_table(
+                        &collection_name,
+                        &model_meta.fields,
+                        &pool.db_config.id_strategy,
+                    )
+                    .await?;
                 }
 
                 // 创建索引
+                let mut all_indexes_ready = true;
                 for index in &model_meta.indexes {
                     let default_name = format!("idx_{}", index.fields.join("_"));
                     let index_name = index.name.as_deref().unwrap_or(&default_name);
@@ -156,11 +215,16 @@ impl PoolManager {
                             }
                             _ => {
                                 warn!("创建索引失败: {} (错误: {})", index_name, e);
+                                all_indexes_ready = false;
                             }
                         }
-                    } else {
                     }
                 }
+
+                // 仅在全部成功时记录，失败的索引下次调用时会重试
+                if all_indexes_ready {
+                    pool.ensured_tables.mark(collection_name, ensure_generation);
+                }
             } else {
                 return Err(QuickDbError::AliasNotFound {
                     alias: alias.to_string(),
@@ -176,3 +240,117 @@ impl PoolManager {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::model::IndexDefinition;
+    use crate::types::{ConnectionConfig, IdStrategy, PoolConfig};
+    use tokio::sync::mpsc;
+
+    /// 构造不启动工作器的连接池，只用于检查表和索引的就绪记录
+    fn test_pool(alias: &str) -> ConnectionPool {
+        let db_config = DatabaseConfig {
+            db_type: DatabaseType::SQLite,
+            connection: ConnectionConfig::SQLite {
+                path: ":memory:".to_string(),
+                create_if_missing: true,
+            },
+            pool: PoolConfig::default(),
+            alias: alias.to_string(),
+            cache: None,
+            id_strategy: IdStrategy::AutoIncrement,
+            version_storage_path: None,
+            enable_versioning: None,
+        };
+        let (operation_sender, _operation_receiver) = mpsc::unbounded_channel();
+
+        ConnectionPool {
+            db_type: db_config.db_type.clone(),
+            db_config,
+            config: ExtendedPoolConfig::default(),
+            operation_sender,
+            cache_manager: None,
+            ensured_tables: Default::default(),
+        }
+    }
+
+    fn test_meta(collection_name: &str, indexes: Vec<IndexDefinition>) -> ModelMeta {
+        ModelMeta {
+            collection_name: collection_name.to_string(),
+            database_alias: Some("default".to_string()),
+            fields: HashMap::new(),
+            indexes,
+            description: None,
+            version: None,
+        }
+    }
+
+    #[test]
+    fn test_register_model_keeps_ensured_state_for_identical_meta() {
+        let manager = PoolManager::new();
+        manager
+            .pools
+            .insert("default".to_string(), Arc::new(test_pool("default")));
+
+        manager.register_model(test_meta("users", Vec::new())).unwrap();
+        let pool = manager.pools.get("default").unwrap().clone();
+        pool.ensured_tables.mark("users", pool.ensured_tables.begin());
+
+        // 元数据完全相同：跳过注册，保留已确认状态
+        manager.register_model(test_meta("users", Vec::new())).unwrap();
+        assert!(pool.ensured_tables.contains("users"));
+
+        // 元数据变化（新增索引）：清除已确认状态，下次写入时重新建索引
+        let index = IndexDefinition {
+            fields: vec!["email".to_string()],
+            unique: true,
+            name: None,
+        };
+        manager.register_model(test_meta("users", vec![index])).unwrap();
+        assert!(!pool.ensured_tables.contains("users"));
+        assert_eq!(
+            manager
+                .get_model_with_alias("users", "default")
+                .unwrap()
+                .indexes
+                .len(),
+            1
+        );
+    }
+
+    #[test]
+    fn test_register_models_batch() {
+        let manager = PoolManager::new();
+
+        manager
+            .register_models(vec![
+                test_meta("users", Vec::new()),
+                test_meta("orders", Vec::new()),
+                test_meta("products", Vec::new()),
+            ])
+            .unwrap();
+        for collection_name in ["users", "orders", "products"] {
+            assert!(manager.get_shared_model(collection_name, "default").is_some());
+        }
+
+        // 中间一项无效：返回带序号的校验错误，整批都不注册
+        let result = manager.register_models(vec![
+            test_meta("tags", Vec::new()),
+            test_meta("", Vec::new()),
+            test_meta("comments", Vec::new()),
+        ]);
+        match result {
+            Err(QuickDbError::ValidationError { field, message }) => {
+                assert_eq!(field, "collection_name");
+                assert!(message.contains("第1个"));
+            }
+            other => panic!("Expected validation error, got {:?}", other),
+        }
+        assert!(manager.get_shared_model("tags", "default").is_none());
+        assert!(manager.get_shared_model("comments", "default").is_none());
+
+        // 单个注册不受批量校验影响
+        assert!(manager.register_model(test_meta("", Vec::new())).is_ok());
+    }
+}
@@ -162,16 +162,18 @@ impl<'a, 'de> serde::de::MapAccess<'de> for DataValueStructDeserializer<'a> {
 }
 
 /// 用于Map访问的反序列化器
+///
+/// 直接借用映射的迭代器，键值成对读取，无需复制键或重新定位当前键
 struct DataValueMapDeserializer<'a> {
-    data: &'a HashMap<String, DataValue>,
-    keys: std::vec::IntoIter<String>,
+    entries: std::collections::hash_map::Iter<'a, String, DataValue>,
+    pending_value: Option<&'a DataValue>,
 }
 
 impl<'a> DataValueMapDeserializer<'a> {
     fn new(data: &'a HashMap<String, DataValue>) -> Self {
         Self {
-            data,
-            keys: data.keys().cloned().collect::<Vec<_>>().into_iter(),
+            entries: data.iter(),
+            pending_value: None,
         }
     }
 }
@@ -183,9 +185,10 @@ impl<'a, 'de> serde::de::MapAccess<'de> for DataValueMapDeserializer<'a> {
     where
         K: serde::de::DeserializeSeed<'de>,
     {
-        match self.keys.next() {
-            Some(key) => {
-                let key_deserializer = serde::de::value::StrDeserializer::new(&key);
+        match self.entries.next() {
+            Some((key, value)) => {
+                self.pending_value = Some(value);
+                let key_deserializer = serde::de::value::StrDeserializer::new(key);
                 seed.deserialize(key_deserializer).map(Some)
             }
             None => Ok(None),
@@ -196,27 +199,15 @@ impl<'a, 'de> serde::de::MapAccess<'de> for DataValueMapDeserializer<'a> {
     where
         V: serde::de::DeserializeSeed<'de>,
     {
-        // 检查最后一个处理的键
-        let key_count = self.keys.as_slice().len();
-        let total_keys = self.data.len();
-
-        if total_keys > 0 && key_count < total_keys {
-            // 通过重新构建key迭代器来获取当前key
-            let all_keys: Vec<String> = self.data.keys().cloned().collect();
-            if let Some(current_key) = all_keys.get(total_keys - key_count - 1) {
-                if let Some(data_value) = self.data.get(current_key) {
-                    let deserializer = DataValueSingleDeserializer::new(data_value);
-                    seed.deserialize(deserializer)
-                } else {
-                    Err(serde::de::Error::custom(crate::i18n::t("model.data_value_not_exist")))
-                }
-            } else {
-                Err(serde::de::Error::custom(crate::i18n::t("model.key_access_error")))
-            }
-        } else {
-            Err(serde::de::Error::custom("键访问错误"))
+        match self.pending_value.take() {
+            Some(data_value) => seed.deserialize(DataValueSingleDeserializer::new(data_value)),
+            None => Err(serde::de::Error::custom(crate::i18n::t("model.key_access_error"))),
         }
     }
+
+    fn size_hint(&self) -> Option<usize> {
+        Some(self.entries.len())
+    }
 }
 
 /// 单个DataValue的反序列化器
@@ -352,6 +343,28 @@ mod tests {
         assert_eq!(model.active, true);
     }
 
+    #[test]
+    fn test_nested_object_to_map() {
+        let mut inner = HashMap::new();
+        inner.insert("a".to_string(), DataValue::Int(1));
+        inner.insert("b".to_string(), DataValue::String("x".to_string()));
+        inner.insert("c".to_string(), DataValue::Bool(false));
+
+        let mut data_map = HashMap::new();
+        data_map.insert("profile".to_string(), DataValue::Object(inner));
+
+        #[derive(Deserialize)]
+        struct Wrapper {
+            profile: HashMap<String, serde_json::Value>,
+        }
+
+        let wrapper: Wrapper = create_model_from_data_map::<Wrapper>(&data_map).unwrap();
+        assert_eq!(wrapper.profile.len(), 3);
+        assert_eq!(wrapper.profile["a"], serde_json::json!(1));
+        assert_eq!(wrapper.profile["b"], serde_json::json!("x"));
+        assert_eq!(wrapper.profile["c"], serde_json::json!(false));
+    }
+
     // ===== i18n 测试 =====
 
     fn setup_i18n(lang: &str) {
@@ -201,7 +201,7 @@ impl FieldDefinition {
                         }
                     }
                     if let Some(pattern) = regex {
-                        let regex = regex::Regex::new(pattern).map_err(|e| {
+                        let regex = cached_regex(pattern).map_err(|e| {
                             QuickDbError::ValidationError {
                                 field: "regex".to_string(),
                                 message: crate::i18n::tf("validation.regex_invalid", &[("error", &e.to_string())]),
@@ -612,7 +612,7 @@ impl FieldDefinition {
 }
 
 /// 模型元数据
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct ModelMeta {
     /// 集合/表名
     pub collection_name: String,
@@ -629,7 +629,7 @@ pub struct ModelMeta {
 }
 
 /// 索引定义
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct IndexDefinition {
     /// 索引字段
     pub fields: Vec<String>,
@@ -1927,35 +1927,52 @@ mod tests {
     }
 }
 
+/// 字段校验正则缓存的最大条目数
+///
+/// 模式来自模型定义，数量通常很少；超过上限（如模式由运行时数据拼接）后不再缓存新模式，
+/// 只按需编译，避免缓存无限增长
+const REGEX_CACHE_CAPACITY: usize = 256;
+
+/// 获取编译后的字段校验正则
+///
+/// 字段定义中的正则在每次校验时都会用到，按模式字符串缓存编译结果；
+/// 编译失败的模式不缓存，每次返回相同的错误
+fn cached_regex(pattern: &str) -> Result<regex::Regex, regex::Error> {
+    static REGEX_CACHE: once_cell::sync::Lazy<dashmap::DashMap<String, regex::Regex>> =
+        once_cell::sync::Lazy::new(dashmap::DashMap::new);
+
+    if let Some(regex) = REGEX_CACHE.get(pattern) {
+        return Ok(regex.value().clone());
+    }
+    let regex = regex::Regex::new(pattern)?;
+    if REGEX_CACHE.len() < REGEX_CACHE_CAPACITY {
+        REGEX_CACHE.insert(pattern.to_string(), regex.clone());
+    }
+    Ok(regex)
+}
+
 /// 验证时区偏移格式是否有效
 ///
 /// 有效格式：+00:00, +08:00, -05:00 等
 fn is_valid_timezone_offset(offset: &str) -> bool {
     // 正则表达式匹配时区偏移格式
     // 格式：+或-，后跟两位数的小时，冒号，两位数的分钟
-    use regex::Regex;
-
-    if let Ok(re) = Regex::new(r"^[+-]\d{2}:\d{2}$") {
-        if !re.is_match(offset) {
-            return false;
-        }
+    static TZ_OFFSET_REGEX: once_cell::sync::Lazy<regex::Regex> =
+        once_cell::sync::Lazy::new(|| regex::Regex::new(r"^[+-]\d{2}:\d{2}$").unwrap());
 
-        // 解析小时和分钟，验证范围
-        let parts: Vec<&str> = offset[1..].split(':').collect();
-        if parts.len() != 2 {
-            return false;
-        }
+    if !TZ_OFFSET_REGEX.is_match(offset) {
+        return false;
+    }
 
-        if let (Ok(hours), Ok(minutes)) = (parts[0].parse::<i32>(), parts[1].parse::<i32>()) {
-            // 小时范围：0-23，分钟范围：0-59
-            if hours > 23 || minutes > 59 {
-                return false;
-            }
-        } else {
-            return false;
-        }
+    // 解析小时和分钟，验证范围
+    let parts: Vec<&str> = offset[1..].split(':').collect();
+    if parts.len() != 2 {
+        return false;
+    }
 
-        true
+    if let (Ok(hours), Ok(minutes)) = (parts[0].parse::<i32>(), parts[1].parse::<i32>()) {
+        // 小时范围：0-23，分钟范围：0-59
+        hours <= 23 && minutes <= 59
     } else {
         false
     }
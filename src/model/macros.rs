@@ -130,44 +130,74 @@ macro_rules! define_model {
             )*
         }
 
-        impl $crate::model::traits::Model for $name {
-            fn meta() -> $crate::model::field_types::ModelMeta {
-                let mut fields = std::collections::HashMap::new();
-                $(
-                    fields.insert(stringify!($field_name).to_string(), $field_def);
-                )*
-
-                let mut indexes = Vec::new();
-                $(
+        impl $name {
+            /// 返回模型元数据的静态引用
+            ///
+            /// 元数据完全由宏参数决定，只在首次调用时构建并注册，之后直接复用。
+            /// 使用带前缀的名称，避免与用户类型上的同名方法冲突
+            #[doc(hidden)]
+            fn __rat_quickdb_cached_meta() -> &'static $crate::model::field_types::ModelMeta {
+                static META: std::sync::OnceLock<$crate::model::field_types::ModelMeta> = std::sync::OnceLock::new();
+
+                META.get_or_init(|| {
+                    let mut fields = std::collections::HashMap::new();
                     $(
-                        indexes.push($crate::model::field_types::IndexDefinition {
-                            fields: vec![$($index_field.to_string()),*],
-                            unique: $unique,
-                            name: None $(.or(Some($index_name.to_string())))?,
-                        });
+                        fields.insert(stringify!($field_name).to_string(), $field_def);
                     )*
-                )?
-
-                let model_meta = $crate::model::field_types::ModelMeta {
-                    collection_name: $collection.to_string(),
-                    database_alias: None $(.or(Some($database.to_string())))?,
-                    fields,
-                    indexes,
-                    description: None,
-                    version: None $(.or(Some($version)))?,
-                };
 
-                // 自动注册模型元数据（仅在首次调用时注册）
-                static ONCE: std::sync::Once = std::sync::Once::new();
-                ONCE.call_once(|| {
+                    let mut indexes = Vec::new();
+                    $(
+                        $(
+                            indexes.push($crate::model::field_types::IndexDefinition {
+                                fields: vec![$($index_field.to_string()),*],
+                                unique: $unique,
+                                name: None $(.or(Some($index_name.to_string())))?,
+                            });
+                        )*
+                    )?
+
+                    let model_meta = $crate::model::field_types::ModelMeta {
+                        collection_name: $collection.to_string(),
+                        database_alias: None $(.or(Some($database.to_string())))?,
+                        fields,
+                        indexes,
+                        description: None,
+                        version: None $(.or(Some($version)))?,
+                    };
+
+                    // 自动注册模型元数据（仅在首次调用时注册）
                     if let Err(e) = $crate::manager::register_model(model_meta.clone()) {
                         panic!("❌ 模型注册失败: {}", e);
                     } else {
                         $crate::debug_log!("✅ 模型自动注册成功: {}", model_meta.collection_name);
                     }
-                });
 
-                model_meta
+                    model_meta
+                })
+            }
+        }
+
+        impl $crate::model::traits::Model for $name {
+            fn meta() -> $crate::model::field_types::ModelMeta {
+                Self::__rat_quickdb_cached_meta().clone()
+            }
+
+            fn collection_name() -> String {
+                Self::__rat_quickdb_cached_meta().collection_name.clone()
+            }
+
+            fn database_alias() -> Option<String> {
+                Self::__rat_quickdb_cached_meta().database_alias.clone()
+            }
+
+            fn validate(&self) -> $crate::error::QuickDbResult<()> {
+                let data = self.to_data_map()?;
+                $crate::model::traits::validate_data_map(&Self::__rat_quickdb_cached_meta().fields, &data)
+            }
+
+            fn from_data_map(data: std::collections::HashMap<String, $crate::types::DataValue>) -> $crate::error::QuickDbResult<Self> {
+                let processed_data = $crate::process_data_fields_from_metadata(data, &Self::__rat_quickdb_cached_meta().fields);
+                $crate::model::data_conversion::create_model_from_data_map::<Self>(&processed_data)
             }
 
             /// 高性能直接转换实现，避免 JSON 序列化开销
@@ -178,7 +208,7 @@ macro_rules! define_model {
                 $crate::debug_log!("🔍 开始 to_data_map_direct 转换...");
 
                 // 获取字段元数据，用于智能转换
-                let meta = Self::meta();
+                let meta = Self::__rat_quickdb_cached_meta();
 
                 $(
                     $crate::debug_log!("🔍 转换字段 {}: {:?}", stringify!($field), self.$field);
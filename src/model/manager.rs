@@ -80,6 +80,43 @@ impl<T: Model> ModelManager<T> {
         <Self as ModelOperations<T>>::find_with_cache_control(conditions_with_config, options, bypass_cache).await
     }
 
+    /// 根据多个ID批量查找模型
+    ///
+    /// 使用单次 `id IN (...)` 查询代替循环调用 `find_by_id`，避免 N+1 查询。
+    /// 返回结果的顺序由数据库决定，不存在的ID会被忽略。
+    /// MongoDB 的 ObjectId 主键由适配器按 `find_by_id` 相同的规则转换；
+    /// 与 `find_by_id` 一致，任一记录转换为模型失败时返回错误而不是静默丢弃。
+    pub async fn find_by_ids(ids: &[&str]) -> QuickDbResult<Vec<T>> {
+        if ids.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let collection_name = T::collection_name();
+        let database_alias = T::database_alias();
+
+        debug!("根据ID批量查找模型: collection={}, count={}", collection_name, ids.len());
+
+        let condition = QueryConditionWithConfig {
+            field: "id".to_string(),
+            operator: QueryOperator::In,
+            value: DataValue::Array(
+                ids.iter().map(|id| DataValue::String(id.to_string())).collect(),
+            ),
+            case_insensitive: false,
+        };
+
+        let rows = odm::find_with_cache_control(
+            &collection_name,
+            vec![condition],
+            None,
+            database_alias.as_deref(),
+            false,
+        )
+        .await?;
+
+        rows_to_models(rows)
+    }
+
     // ========== 完整方法：接受 QueryConditionWithConfig ==========
 
     /// 查找模型（带配置）
@@ -138,6 +175,29 @@ impl<T: Model> ModelManager<T> {
     }
 }
 
+/// 将查询返回的记录转换为模型，任一记录转换失败即返回错误
+fn rows_to_models<T: Model>(rows: Vec<DataValue>) -> QuickDbResult<Vec<T>> {
+    let mut models = Vec::with_capacity(rows.len());
+    for data_value in rows {
+        let model: T = match data_value {
+            DataValue::Object(data_map) => {
+                crate::debug_log!("批量查询收到的数据: {:?}", data_map);
+                T::from_data_map(data_map).map_err(|e| {
+                    debug!("❌ 批量查询from_data_map失败: {}", e);
+                    e
+                })?
+            }
+            _ => {
+                // 兼容其他格式，使用直接反序列化
+                crate::debug_log!("批量查询收到非Object格式数据: {:?}", data_value);
+                data_value.deserialize_to()?
+            }
+        };
+        models.push(model);
+    }
+    Ok(models)
+}
+
 #[async_trait]
 impl<T: Model> ModelOperations<T> for ModelManager<T> {
     async fn save(&self) -> QuickDbResult<String> {
@@ -160,11 +220,11 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
             // 处理 DataValue::Object 格式的数据
             match data_value {
                 DataValue::Object(data_map) => {
-                    debug!("从数据库收到的数据: {:?}", data_map);
-                    let model: T = match T::from_data_map(data_map.clone()) {
+                    crate::debug_log!("从数据库收到的数据: {:?}", data_map);
+                    let model: T = match T::from_data_map(data_map) {
                         Ok(model) => model,
                         Err(e) => {
-                            debug!("❌ from_data_map失败: {}, 数据: {:?}", e, data_map);
+                            debug!("❌ from_data_map失败: {}", e);
                             return Err(e);
                         }
                     };
@@ -172,7 +232,7 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
                 }
                 _ => {
                     // 兼容其他格式，使用直接反序列化
-                    debug!("收到非Object格式数据: {:?}", data_value);
+                    crate::debug_log!("收到非Object格式数据: {:?}", data_value);
                     let model: T = data_value.deserialize_to()?;
                     Ok(Some(model))
                 }
@@ -202,16 +262,16 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
         .await?;
 
         // result 已经是 Vec<DataValue>，直接处理
-        let mut models = Vec::new();
+        let mut models = Vec::with_capacity(result.len());
         for data_value in result {
             // 处理 DataValue::Object 格式的数据
             match data_value {
                 DataValue::Object(data_map) => {
-                    debug!("查询收到的数据: {:?}", data_map);
-                    let model: T = match T::from_data_map(data_map.clone()) {
+                    crate::debug_log!("查询收到的数据: {:?}", data_map);
+                    let model: T = match T::from_data_map(data_map) {
                         Ok(model) => model,
                         Err(e) => {
-                            debug!("❌ 查询from_data_map失败: {}, 数据: {:?}", e, data_map);
+                            debug!("❌ 查询from_data_map失败: {}", e);
                             continue;
                         }
                     };
@@ -219,7 +279,7 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
                 }
                 _ => {
                     // 兼容其他格式，使用直接反序列化
-                    debug!("查询收到非Object格式数据: {:?}", data_value);
+                    crate::debug_log!("查询收到非Object格式数据: {:?}", data_value);
                     let model: T = data_value.deserialize_to()?;
                     models.push(model);
                 }
@@ -306,7 +366,7 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
         .await?;
 
         // 处理返回的 DataValue 数据
-        let mut models = Vec::new();
+        let mut models = Vec::with_capacity(result.len());
         for data_value in result {
             let model: T = T::from_data_map(data_value.expect_object()?)?;
             models.push(model);
@@ -348,7 +408,7 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
         .await?;
 
         // 处理返回的 DataValue 数据
-        let mut models = Vec::new();
+        let mut models = Vec::with_capacity(result.len());
         for data_value in result {
             let model: T = T::from_data_map(data_value.expect_object()?)?;
             models.push(model);
@@ -468,3 +528,55 @@ impl<T: Model> ModelOperations<T> for ModelManager<T> {
             .await
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::model::field_types::ModelMeta;
+    use serde::{Deserialize, Serialize};
+
+    #[derive(Debug, Serialize, Deserialize)]
+    struct BatchItem {
+        id: String,
+        count: i64,
+    }
+
+    impl Model for BatchItem {
+        fn meta() -> ModelMeta {
+            ModelMeta {
+                collection_name: "batch_items".to_string(),
+                database_alias: None,
+                fields: HashMap::new(),
+                indexes: Vec::new(),
+                description: None,
+                version: None,
+            }
+        }
+    }
+
+    fn row(id: &str, count: DataValue) -> DataValue {
+        let mut map = HashMap::new();
+        map.insert("id".to_string(), DataValue::String(id.to_string()));
+        map.insert("count".to_string(), count);
+        DataValue::Object(map)
+    }
+
+    #[test]
+    fn test_rows_to_models_converts_all_rows() {
+        let rows = vec![row("a", DataValue::Int(1)), row("b", DataValue::Int(2))];
+        let models: Vec<BatchItem> = rows_to_models(rows).unwrap();
+        assert_eq!(models.len(), 2);
+        assert_eq!(models[0].id, "a");
+        assert_eq!(models[1].count, 2);
+    }
+
+    #[test]
+    fn test_rows_to_models_reports_bad_row() {
+        // 无法转换的记录必须返回错误，而不是被静默丢弃
+        let rows = vec![
+            row("a", DataValue::Int(1)),
+            row("b", DataValue::String("not a number".to_string())),
+        ];
+        assert!(rows_to_models::<BatchItem>(rows).is_err());
+    }
+}
@@ -8,12 +8,32 @@ use crate::model::field_types::{FieldDefinition, FieldType, ModelMeta};
 use crate::types::*;
 use async_trait::async_trait;
 use base64;
-use rat_logger::{debug, error, info, warn};
+use rat_logger::{error, info, warn};
 use serde::{Deserialize, Serialize};
 use serde_json::Value as JsonValue;
 use std::collections::HashMap;
 use std::marker::PhantomData;
 
+/// 按字段定义校验模型数据映射
+///
+/// `Model::validate` 的默认实现和 `define_model!` 生成的实现共用此函数，缺失的字段按 `Null` 校验
+#[doc(hidden)]
+pub fn validate_data_map(
+    fields: &HashMap<String, FieldDefinition>,
+    data: &HashMap<String, DataValue>,
+) -> QuickDbResult<()> {
+    // 调试信息：打印序列化后的数据
+    crate::debug_log!("🔍 验证数据映射: {:?}", data);
+
+    for (field_name, field_def) in fields {
+        let field_value = data.get(field_name).unwrap_or(&DataValue::Null);
+        crate::debug_log!("🔍 验证字段 {}: {:?}", field_name, field_value);
+        field_def.validate_with_field_name(field_value, field_name)?;
+    }
+
+    Ok(())
+}
+
 /// 模型特征
 ///
 /// 所有模型都必须实现这个特征
@@ -35,17 +55,7 @@ pub trait Model: Serialize + for<'de> Deserialize<'de> + Send + Sync {
     fn validate(&self) -> QuickDbResult<()> {
         let meta = Self::meta();
         let data = self.to_data_map()?;
-
-        // 调试信息：打印序列化后的数据
-        debug!("🔍 验证数据映射: {:?}", data);
-
-        for (field_name, field_def) in &meta.fields {
-            let field_value = data.get(field_name).unwrap_or(&DataValue::Null);
-            debug!("🔍 验证字段 {}: {:?}", field_name, field_value);
-            field_def.validate_with_field_name(field_value, field_name)?;
-        }
-
-        Ok(())
+        validate_data_map(&meta.fields, &data)
     }
 
     /// 转换为数据映射（直接转换，避免 JSON 序列化开销）
@@ -63,19 +73,19 @@ pub trait Model: Serialize + for<'de> Deserialize<'de> + Send + Sync {
             serde_json::to_string(self).map_err(|e| QuickDbError::SerializationError {
                 message: crate::i18n::tf("serializer.serialize_failed", &[("message", &e.to_string())]),
             })?;
-        debug!("🔍 序列化后的JSON字符串: {}", json_str);
+        crate::debug_log!("🔍 序列化后的JSON字符串: {}", json_str);
 
         let json_value: JsonValue =
             serde_json::from_str(&json_str).map_err(|e| QuickDbError::SerializationError {
                 message: crate::i18n::tf("model.parse_json_failed", &[("message", &e.to_string())]),
             })?;
-        debug!("🔍 解析后的JsonValue: {:?}", json_value);
+        crate::debug_log!("🔍 解析后的JsonValue: {:?}", json_value);
 
         let mut data_map = HashMap::new();
         if let JsonValue::Object(obj) = json_value {
             for (key, value) in obj {
                 let data_value = DataValue::from_json(value.clone());
-                debug!("🔍 字段 {} 转换: {:?} -> {:?}", key, value, data_value);
+                crate::debug_log!("🔍 字段 {} 转换: {:?} -> {:?}", key, value, data_value);
                 data_map.insert(key, data_value);
             }
         }
@@ -113,14 +123,14 @@ pub trait Model: Serialize + for<'de> Deserialize<'de> + Send + Sync {
                 message: crate::i18n::tf("serializer.serialize_failed", &[("message", &e.to_string())]),
             })?;
 
-        debug!("🔍 to_data_map_with_types_json 序列化的JSON: {}", json_str);
+        crate::debug_log!("🔍 to_data_map_with_types_json 序列化的JSON: {}", json_str);
 
         let json_value: JsonValue =
             serde_json::from_str(&json_str).map_err(|e| QuickDbError::SerializationError {
                 message: crate::i18n::tf("model.parse_json_failed", &[("message", &e.to_string())]),
             })?;
 
-        debug!(
+        crate::debug_log!(
             "🔍 to_data_map_with_types_json 解析后的JSON: {:?}",
             json_value
         );
@@ -42,20 +42,19 @@ impl AsyncOdmManager {
             // 不返回错误，让适配器处理自动创建逻辑
         }
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 获取ID策略用于传递给适配器，必须提供有效策略
         let id_strategy = connection_pool.db_config.id_strategy.clone();
 
         // 根据ID策略处理ID字段
-        let mut processed_data = data.clone();
+        let mut processed_data = data;
 
         if let Ok(id_generator) = manager.get_id_generator(&actual_alias) {
             match id_generator.strategy() {
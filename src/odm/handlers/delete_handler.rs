@@ -30,14 +30,13 @@ impl AsyncOdmManager {
             collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -87,14 +86,13 @@ impl AsyncOdmManager {
             collection, id, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -144,14 +142,13 @@ impl AsyncOdmManager {
             collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -201,14 +198,13 @@ impl AsyncOdmManager {
             collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -251,14 +247,13 @@ impl AsyncOdmManager {
         };
         debug!("处理版本查询请求: alias={}", actual_alias);
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 使用生产者/消费者模式发送操作到连接池
         let (response_tx, response_rx) = tokio::sync::oneshot::channel();
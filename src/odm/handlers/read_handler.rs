@@ -30,14 +30,13 @@ impl AsyncOdmManager {
             collection, id, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -87,14 +86,13 @@ impl AsyncOdmManager {
             bypass_cache, collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -157,14 +155,13 @@ impl AsyncOdmManager {
             bypass_cache, collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -32,14 +32,13 @@ impl AsyncOdmManager {
             collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -91,14 +90,13 @@ impl AsyncOdmManager {
             collection, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -150,14 +148,13 @@ impl AsyncOdmManager {
             collection, id, actual_alias
         );
 
-        let manager = get_global_pool_manager();
-        let connection_pools = manager.get_connection_pools();
-        let connection_pool =
-            connection_pools
-                .get(&actual_alias)
-                .ok_or_else(|| QuickDbError::AliasNotFound {
-                    alias: actual_alias.clone(),
-                })?;
+        let connection_pool = manager
+            .pools
+            .get(&actual_alias)
+            .map(|pool| pool.value().clone())
+            .ok_or_else(|| QuickDbError::AliasNotFound {
+                alias: actual_alias.clone(),
+            })?;
 
         // 创建oneshot通道用于接收响应
         let (response_tx, response_rx) = oneshot::channel();
@@ -7,6 +7,11 @@ use crate::types::*;
 use rat_logger::{debug, error, info, warn};
 use tokio::sync::{mpsc, oneshot};
 
+/// 后台任务同时处理的ODM请求上限
+///
+/// 每个别名的连接池工作器仍按队列执行，更高的并发不会提升吞吐，只会让等待中的任务堆积
+const MAX_IN_FLIGHT_REQUESTS: usize = 32;
+
 /// 异步ODM管理器 - 使用消息传递避免生命周期问题
 pub struct AsyncOdmManager {
     /// 请求发送器
@@ -46,180 +51,201 @@ impl AsyncOdmManager {
     }
 
     /// 后台请求处理任务
+    ///
+    /// 每个请求在独立任务中处理，互不相关的请求（如操作不同表）可以重叠各自的数据库往返，
+    /// 不再被前一个请求阻塞；同一调用方按顺序await的请求仍保持原有顺序。
+    /// 子任务由 `JoinSet` 持有，后台任务被 abort 时会一并取消仍在执行的请求。
+    /// 同时执行的请求数不超过 `MAX_IN_FLIGHT_REQUESTS`，达到上限时等待已有请求完成再接收新请求，
+    /// 突发调用时请求留在通道中排队，而不是无限创建任务。
     async fn process_requests(mut receiver: mpsc::UnboundedReceiver<OdmRequest>) {
         info!("启动ODM后台处理任务");
 
+        let mut in_flight = tokio::task::JoinSet::new();
         while let Some(request) = receiver.recv().await {
-            match request {
-                OdmRequest::Create {
-                    collection,
-                    data,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_create(&collection, data, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::FindById {
-                    collection,
-                    id,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_find_by_id(&collection, &id, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::Find {
-                    collection,
-                    conditions,
-                    options,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_find_with_cache_control(&collection, conditions, options, alias, false).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::FindWithCacheControl {
-                    collection,
-                    conditions,
-                    options,
-                    alias,
-                    bypass_cache,
-                    response,
-                } => {
-                    let result = Self::handle_find_with_cache_control(&collection, conditions, options, alias, bypass_cache).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::FindWithGroups {
-                    collection,
-                    condition_groups,
-                    options,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_find_with_groups(&collection, condition_groups, options, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::FindWithGroupsWithCacheControl {
-                    collection,
-                    condition_groups,
-                    options,
-                    alias,
-                    bypass_cache,
-                    response,
-                } => {
-                    let result = Self::handle_find_with_groups_with_cache_control(&collection, condition_groups, options, alias, bypass_cache).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::Update {
-                    collection,
-                    conditions,
-                    updates,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_update(&collection, conditions, updates, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::UpdateWithOperations {
-                    collection,
+            // 回收已完成的子任务
+            while in_flight.try_join_next().is_some() {}
+            // 达到并发上限时施加背压
+            while in_flight.len() >= MAX_IN_FLIGHT_REQUESTS {
+                in_flight.join_next().await;
+            }
+            in_flight.spawn(Self::dispatch_request(request));
+        }
+
+        // 通道关闭后等待剩余请求处理完毕
+        while in_flight.join_next().await.is_some() {}
+
+        warn!("ODM后台处理任务结束");
+    }
+
+    /// 分发单个ODM请求到对应的处理函数并回传结果
+    async fn dispatch_request(request: OdmRequest) {
+        match request {
+            OdmRequest::Create {
+                collection,
+                data,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_create(&collection, data, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::FindById {
+                collection,
+                id,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_find_by_id(&collection, &id, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::Find {
+                collection,
+                conditions,
+                options,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_find_with_cache_control(&collection, conditions, options, alias, false).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::FindWithCacheControl {
+                collection,
+                conditions,
+                options,
+                alias,
+                bypass_cache,
+                response,
+            } => {
+                let result = Self::handle_find_with_cache_control(&collection, conditions, options, alias, bypass_cache).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::FindWithGroups {
+                collection,
+                condition_groups,
+                options,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_find_with_groups(&collection, condition_groups, options, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::FindWithGroupsWithCacheControl {
+                collection,
+                condition_groups,
+                options,
+                alias,
+                bypass_cache,
+                response,
+            } => {
+                let result = Self::handle_find_with_groups_with_cache_control(&collection, condition_groups, options, alias, bypass_cache).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::Update {
+                collection,
+                conditions,
+                updates,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_update(&collection, conditions, updates, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::UpdateWithOperations {
+                collection,
+                conditions,
+                operations,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_update_with_operations(
+                    &collection,
                     conditions,
                     operations,
                     alias,
-                    response,
-                } => {
-                    let result = Self::handle_update_with_operations(
-                        &collection,
-                        conditions,
-                        operations,
-                        alias,
-                    )
-                    .await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::UpdateById {
-                    collection,
-                    id,
-                    updates,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_update_by_id(&collection, &id, updates, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::Upsert {
-                    collection,
-                    data,
-                    conflict_columns,
-                    alias,
-                    response,
-                } => {
-                    let result =
-                        Self::handle_upsert(&collection, data, conflict_columns, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::Delete {
-                    collection,
-                    conditions,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_delete(&collection, conditions, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::DeleteById {
-                    collection,
-                    id,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_delete_by_id(&collection, &id, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::Count {
-                    collection,
-                    conditions,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_count(&collection, conditions, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::CountWithGroups {
-                    collection,
-                    condition_groups,
-                    alias,
-                    response,
-                } => {
-                    let result = Self::handle_count_with_groups(&collection, condition_groups, alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::GetServerVersion { alias, response } => {
-                    let result = Self::handle_get_server_version(alias).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::CreateStoredProcedure { config, response } => {
-                    let result = Self::handle_create_stored_procedure(config).await;
-                    let _ = response.send(result);
-                }
-                OdmRequest::ExecuteStoredProcedure {
-                    procedure_name,
-                    database_alias,
+                )
+                .await;
+                let _ = response.send(result);
+            }
+            OdmRequest::UpdateById {
+                collection,
+                id,
+                updates,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_update_by_id(&collection, &id, updates, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::Upsert {
+                collection,
+                data,
+                conflict_columns,
+                alias,
+                response,
+            } => {
+                let result =
+                    Self::handle_upsert(&collection, data, conflict_columns, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::Delete {
+                collection,
+                conditions,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_delete(&collection, conditions, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::DeleteById {
+                collection,
+                id,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_delete_by_id(&collection, &id, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::Count {
+                collection,
+                conditions,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_count(&collection, conditions, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::CountWithGroups {
+                collection,
+                condition_groups,
+                alias,
+                response,
+            } => {
+                let result = Self::handle_count_with_groups(&collection, condition_groups, alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::GetServerVersion { alias, response } => {
+                let result = Self::handle_get_server_version(alias).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::CreateStoredProcedure { config, response } => {
+                let result = Self::handle_create_stored_procedure(config).await;
+                let _ = response.send(result);
+            }
+            OdmRequest::ExecuteStoredProcedure {
+                procedure_name,
+                database_alias,
+                params,
+                response,
+            } => {
+                let result = Self::handle_execute_stored_procedure(
+                    &procedure_name,
+                    database_alias.as_deref(),
                     params,
-                    response,
-                } => {
-                    let result = Self::handle_execute_stored_procedure(
-                        &procedure_name,
-                        database_alias.as_deref(),
-                        params,
-                    )
-                    .await;
-                    let _ = response.send(result);
-                }
+                )
+                .await;
+                let _ = response.send(result);
             }
         }
-
-        warn!("ODM后台处理任务结束");
     }
 
     /// 处理存储过程创建请求
@@ -4,6 +4,7 @@ use crossbeam_queue::SegQueue;
 use rat_logger::{debug, error, info, warn};
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::{Duration, Instant};
 use tokio::sync::{mpsc, oneshot};
 
@@ -18,6 +19,43 @@ use crate::error::{QuickDbError, QuickDbResult};
 use crate::model::FieldDefinition;
 use crate::types::*;
 
+/// 已确认表和索引就绪的集合记录
+///
+/// 带一个变更代数：每次失效（删表、适配器自动建表、元数据变化）都会递增，
+/// 确认流程开始前记下代数，结束时代数已变化则放弃记录，避免并发删表后留下过期状态
+#[derive(Debug, Default)]
+pub(crate) struct EnsuredTables {
+    tables: dashmap::DashSet<String>,
+    generation: AtomicU64,
+}
+
+impl EnsuredTables {
+    /// 表是否已确认就绪
+    pub(crate) fn contains(&self, table: &str) -> bool {
+        self.tables.contains(table)
+    }
+
+    /// 开始一次确认流程，返回当前代数
+    pub(crate) fn begin(&self) -> u64 {
+        self.generation.load(Ordering::SeqCst)
+    }
+
+    /// 记录表已就绪；确认期间发生过失效则不记录
+    pub(crate) fn mark(&self, table: &str, generation: u64) {
+        self.tables.insert(table.to_string());
+        // 先插入再检查代数：与 invalidate 的“先递增再删除”配合，任意交错下都不会残留过期记录
+        if self.generation.load(Ordering::SeqCst) != generation {
+            self.tables.remove(table);
+        }
+    }
+
+    /// 使表的就绪记录失效，下次写入时重新检查表和索引
+    pub(crate) fn invalidate(&self, table: &str) {
+        self.generation.fetch_add(1, Ordering::SeqCst);
+        self.tables.remove(table);
+    }
+}
+
 /// 新的连接池 - 基于生产者/消费者模式
 #[derive(Debug)]
 pub struct ConnectionPool {
@@ -31,6 +69,8 @@ pub struct ConnectionPool {
     pub db_type: DatabaseType,
     /// 缓存管理器（可选）
     pub cache_manager: Option<Arc<crate::cache::CacheManager>>,
+    /// 已确认表和索引就绪的集合，避免每次写入都重复检查表存在性和创建索引
+    pub(crate) ensured_tables: EnsuredTables,
 }
 
 impl ConnectionPool {
@@ -56,6 +96,7 @@ impl ConnectionPool {
             config: config.clone(),
             operation_sender,
             cache_manager: cache_manager.clone(),
+            ensured_tables: EnsuredTables::default(),
         };
 
         // 根据数据库类型启动对应的工作器
@@ -595,11 +636,16 @@ impl ConnectionPool {
                 message: crate::i18n::t("pool.send_operation_failed"),
             })?;
 
-        response_receiver
+        let result = response_receiver
             .await
             .map_err(|_| QuickDbError::QueryError {
                 message: crate::i18n::t("pool.receive_response_failed"),
-            })?
+            })?;
+
+        // 表已删除，下次写入时需要重新建表和索引
+        self.ensured_tables.invalidate(table);
+
+        result
     }
 
     /// 获取数据库类型
@@ -630,3 +676,36 @@ impl ConnectionPool {
         debug!("清理过期连接（新架构中自动管理）");
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_ensured_tables_mark_and_invalidate() {
+        let ensured = EnsuredTables::default();
+        let generation = ensured.begin();
+        ensured.mark("users", generation);
+        assert!(ensured.contains("users"));
+
+        // 删表或适配器自动建表后记录失效
+        ensured.invalidate("users");
+        assert!(!ensured.contains("users"));
+    }
+
+    #[test]
+    fn test_ensured_tables_discards_mark_after_concurrent_invalidate() {
+        let ensured = EnsuredTables::default();
+
+        // 确认流程进行中表被删除：结束时不能记录为就绪
+        let generation = ensured.begin();
+        ensured.invalidate("users");
+        ensured.mark("users", generation);
+        assert!(!ensured.contains("users"));
+
+        // 重新确认后正常记录
+        let generation = ensured.begin();
+        ensured.mark("users", generation);
+        assert!(ensured.contains("users"));
+    }
+}
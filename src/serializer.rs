@@ -167,6 +167,26 @@ impl SerializationResult {
         }
     }
 
+    /// 转换为JSON字符串（消耗自身）
+    ///
+    /// 已是字符串时直接移出，避免复制整个结果
+    pub fn into_json_string(self) -> QuickDbResult<String> {
+        match self {
+            SerializationResult::JsonString(s) => Ok(s),
+            other => other.to_json_string(),
+        }
+    }
+
+    /// 转换为JSON对象（消耗自身）
+    ///
+    /// 已是JSON对象时直接移出，避免深拷贝
+    pub fn into_json_object(self) -> QuickDbResult<JsonValue> {
+        match self {
+            SerializationResult::JsonObject(obj) => Ok(obj),
+            other => other.to_json_object(),
+        }
+    }
+
     /// 转换为原始数据
     pub fn to_raw_data(&self) -> QuickDbResult<HashMap<String, DataValue>> {
         match self {
@@ -247,19 +267,17 @@ impl DataSerializer {
     ) -> QuickDbResult<SerializationResult> {
         debug!("序列化多个记录: {} 条记录", records.len());
 
-        let mut processed_records = Vec::new();
-        for record in records {
-            let processed_data = self.process_data(record)?;
-            processed_records.push(processed_data);
-        }
+        let processed_records = records
+            .into_iter()
+            .map(|record| self.process_data(record))
+            .collect::<QuickDbResult<Vec<_>>>()?;
 
         match self.config.format {
             OutputFormat::JsonString => {
-                let mut json_array = Vec::new();
-                for record in processed_records {
-                    let json_obj = data_map_to_json_value(&record)?;
-                    json_array.push(json_obj);
-                }
+                let json_array = processed_records
+                    .iter()
+                    .map(data_map_to_json_value)
+                    .collect::<QuickDbResult<Vec<_>>>()?;
 
                 let json_str = if self.config.pretty {
                     serde_json::to_string_pretty(&json_array)
@@ -273,11 +291,10 @@ impl DataSerializer {
                 Ok(SerializationResult::JsonString(json_str))
             }
             OutputFormat::JsonObject => {
-                let mut json_array = Vec::new();
-                for record in processed_records {
-                    let json_obj = data_map_to_json_value(&record)?;
-                    json_array.push(json_obj);
-                }
+                let json_array = processed_records
+                    .iter()
+                    .map(data_map_to_json_value)
+                    .collect::<QuickDbResult<Vec<_>>>()?;
                 Ok(SerializationResult::JsonObject(JsonValue::Array(
                     json_array,
                 )))
@@ -308,29 +325,17 @@ impl DataSerializer {
     ) -> QuickDbResult<SerializationResult> {
         debug!("序列化查询结果: {} 条记录", records.len());
 
-        let mut result_data = HashMap::new();
-
-        // 序列化记录
-        let records_result = self.serialize_records(records)?;
-        match records_result {
-            SerializationResult::JsonObject(JsonValue::Array(arr)) => {
-                result_data.insert(
-                    "data".to_string(),
-                    DataValue::Array(arr.into_iter().map(|v| DataValue::from_json(v)).collect()),
-                );
-            }
-            SerializationResult::RawData(raw) => {
-                if let Some(DataValue::Array(records)) = raw.get("records") {
-                    result_data.insert("data".to_string(), DataValue::Array(records.clone()));
-                }
-            }
-            _ => {
-                return Err(QuickDbError::SerializationError {
-                    message: crate::i18n::t("serializer.cannot_process_result"),
-                });
-            }
+        // 记录只做配置处理后直接放入结果，最终按输出格式统一转换一次，
+        // 避免先转成JSON再逐条转回DataValue的重复遍历
+        let record_count = records.len();
+        let mut processed_records = Vec::with_capacity(record_count);
+        for record in records {
+            processed_records.push(DataValue::Object(self.process_data(record)?));
         }
 
+        let mut result_data = HashMap::new();
+        result_data.insert("data".to_string(), DataValue::Array(processed_records));
+
         // 添加元数据
         if let Some(count) = total_count {
             result_data.insert("total_count".to_string(), DataValue::Int(count as i64));
@@ -340,16 +345,7 @@ impl DataSerializer {
             result_data.insert("has_more".to_string(), DataValue::Bool(more));
         }
 
-        result_data.insert(
-            "count".to_string(),
-            DataValue::Int(
-                if let Some(DataValue::Array(data)) = result_data.get("data") {
-                    data.len() as i64
-                } else {
-                    0
-                },
-            ),
-        );
+        result_data.insert("count".to_string(), DataValue::Int(record_count as i64));
 
         // 根据配置格式返回结果
         match self.config.format {
@@ -410,7 +406,7 @@ impl DataSerializer {
 
 /// 将DataValue映射转换为JsonValue
 fn data_map_to_json_value(data: &HashMap<String, DataValue>) -> QuickDbResult<JsonValue> {
-    let mut json_map = JsonMap::new();
+    let mut json_map = JsonMap::with_capacity(data.len());
 
     for (key, value) in data {
         json_map.insert(key.clone(), value.to_json_value());
@@ -446,19 +442,19 @@ static RUST_SERIALIZER: once_cell::sync::Lazy<DataSerializer> =
 /// 便捷函数：使用默认配置序列化记录
 pub fn serialize_record(data: HashMap<String, DataValue>) -> QuickDbResult<String> {
     let result = DEFAULT_SERIALIZER.serialize_record(data)?;
-    result.to_json_string()
+    result.into_json_string()
 }
 
 /// 便捷函数：使用默认配置序列化多个记录
 pub fn serialize_records(records: Vec<HashMap<String, DataValue>>) -> QuickDbResult<String> {
     let result = DEFAULT_SERIALIZER.serialize_records(records)?;
-    result.to_json_string()
+    result.into_json_string()
 }
 
 /// 便捷函数：使用Rust原生配置序列化记录
 pub fn serialize_record_for_rust(data: HashMap<String, DataValue>) -> QuickDbResult<JsonValue> {
     let result = RUST_SERIALIZER.serialize_record(data)?;
-    result.to_json_object()
+    result.into_json_object()
 }
 
 /// 便捷函数：使用Rust原生配置序列化多个记录
@@ -466,7 +462,7 @@ pub fn serialize_records_for_rust(
     records: Vec<HashMap<String, DataValue>>,
 ) -> QuickDbResult<JsonValue> {
     let result = RUST_SERIALIZER.serialize_records(records)?;
-    result.to_json_object()
+    result.into_json_object()
 }
 
 /// 便捷函数：序列化查询结果
@@ -476,7 +472,7 @@ pub fn serialize_query_result(
     has_more: Option<bool>,
 ) -> QuickDbResult<String> {
     let result = DEFAULT_SERIALIZER.serialize_query_result(records, total_count, has_more)?;
-    result.to_json_string()
+    result.into_json_string()
 }
 
 /// 便捷函数：为Rust序列化查询结果
@@ -486,7 +482,7 @@ pub fn serialize_query_result_for_rust(
     has_more: Option<bool>,
 ) -> QuickDbResult<JsonValue> {
     let result = RUST_SERIALIZER.serialize_query_result(records, total_count, has_more)?;
-    result.to_json_object()
+    result.into_json_object()
 }
 
 #[cfg(test)]
@@ -570,6 +566,22 @@ mod tests {
         assert!(result.to_json_string().is_ok());
     }
 
+    #[test]
+    fn test_serialize_query_result_keeps_records() {
+        let mut record = HashMap::new();
+        record.insert("name".to_string(), DataValue::String("alice".to_string()));
+        record.insert("age".to_string(), DataValue::Int(30));
+
+        let json = serialize_query_result_for_rust(vec![record], Some(1), Some(false)).unwrap();
+        assert_eq!(json["count"], 1);
+        assert_eq!(json["data"][0]["name"], "alice");
+        assert_eq!(json["data"][0]["age"], 30);
+
+        let json_str = serialize_query_result(vec![], None, None).unwrap();
+        let parsed: JsonValue = serde_json::from_str(&json_str).unwrap();
+        assert_eq!(parsed["count"], 0);
+    }
+
     #[test]
     fn test_to_raw_data_success_from_raw_data() {
         let mut data = HashMap::new();
@@ -358,6 +358,90 @@ pub fn json_value_to_data_value(value: serde_json::Value) -> DataValue {
     }
 }
 
+/// 直接从JSON文本构建DataValue的反序列化包装
+///
+/// 转换规则与 `json_value_to_data_value` 一致，但在解析过程中一次完成，
+/// 不再先构建完整的 serde_json::Value 树再遍历转换
+struct JsonDataValue(DataValue);
+
+impl<'de> Deserialize<'de> for JsonDataValue {
+    fn deserialize<D>(deserializer: D) -> Result<Self, D::Error>
+    where
+        D: serde::Deserializer<'de>,
+    {
+        deserializer.deserialize_any(JsonDataValueVisitor)
+    }
+}
+
+struct JsonDataValueVisitor;
+
+impl<'de> serde::de::Visitor<'de> for JsonDataValueVisitor {
+    type Value = JsonDataValue;
+
+    fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+        formatter.write_str("any valid JSON value")
+    }
+
+    fn visit_unit<E>(self) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::Null))
+    }
+
+    fn visit_none<E>(self) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::Null))
+    }
+
+    fn visit_bool<E>(self, v: bool) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::Bool(v)))
+    }
+
+    fn visit_i64<E>(self, v: i64) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::Int(v)))
+    }
+
+    fn visit_u64<E>(self, v: u64) -> Result<Self::Value, E> {
+        // 与 json_value_to_data_value 保持一致：能放进i64的优先使用Int
+        if v <= i64::MAX as u64 {
+            Ok(JsonDataValue(DataValue::Int(v as i64)))
+        } else {
+            Ok(JsonDataValue(DataValue::UInt(v)))
+        }
+    }
+
+    fn visit_f64<E>(self, v: f64) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::Float(v)))
+    }
+
+    fn visit_str<E>(self, v: &str) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::String(v.to_string())))
+    }
+
+    fn visit_string<E>(self, v: String) -> Result<Self::Value, E> {
+        Ok(JsonDataValue(DataValue::String(v)))
+    }
+
+    fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
+    where
+        A: serde::de::SeqAccess<'de>,
+    {
+        let mut data_array = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(JsonDataValue(item)) = seq.next_element()? {
+            data_array.push(item);
+        }
+        Ok(JsonDataValue(DataValue::Array(data_array)))
+    }
+
+    fn visit_map<A>(self, mut map: A) -> Result<Self::Value, A::Error>
+    where
+        A: serde::de::MapAccess<'de>,
+    {
+        let mut data_object = HashMap::with_capacity(map.size_hint().unwrap_or(0));
+        while let Some((key, JsonDataValue(value))) = map.next_entry::<String, JsonDataValue>()? {
+            data_object.insert(key, value);
+        }
+        Ok(JsonDataValue(DataValue::Object(data_object)))
+    }
+}
+
 /// SQL适配器通用的JSON字符串检测和反序列化方法
 /// 基于SQLite成功的修复方案，用于处理存储为JSON字符串的数组和对象字段
 ///
@@ -370,12 +454,9 @@ pub fn json_value_to_data_value(value: serde_json::Value) -> DataValue {
 pub fn parse_json_string_to_data_value(value: String) -> DataValue {
     // 检查字符串是否以JSON数组或对象标识符开头
     if value.starts_with('[') || value.starts_with('{') {
-        // 尝试解析为JSON
-        match serde_json::from_str::<serde_json::Value>(&value) {
-            Ok(json_value) => {
-                // 根据JSON类型返回对应的DataValue
-                json_value_to_data_value(json_value)
-            }
+        // 尝试解析为JSON，解析时直接构建对应的DataValue
+        match serde_json::from_str::<JsonDataValue>(&value) {
+            Ok(JsonDataValue(data_value)) => data_value,
             Err(_) => {
                 // 解析失败，作为普通字符串处理
                 DataValue::String(value)
@@ -636,3 +717,83 @@ where
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_json_string_nested_array_and_object() {
+        let value = parse_json_string_to_data_value(
+            r#"{"tags":["a",["b",1]],"meta":{"active":true,"score":1.5,"note":null}}"#
+                .to_string(),
+        );
+
+        let DataValue::Object(obj) = value else {
+            panic!("Expected object");
+        };
+        assert_eq!(
+            obj.get("tags"),
+            Some(&DataValue::Array(vec![
+                DataValue::String("a".to_string()),
+                DataValue::Array(vec![DataValue::String("b".to_string()), DataValue::Int(1)]),
+            ]))
+        );
+
+        let Some(DataValue::Object(meta)) = obj.get("meta") else {
+            panic!("Expected nested object");
+        };
+        assert_eq!(meta.get("active"), Some(&DataValue::Bool(true)));
+        assert_eq!(meta.get("score"), Some(&DataValue::Float(1.5)));
+        assert_eq!(meta.get("note"), Some(&DataValue::Null));
+    }
+
+    #[test]
+    fn test_parse_json_string_numbers() {
+        let value = parse_json_string_to_data_value(
+            format!("[{}, {}, -3, 2.25]", i64::MAX, u64::MAX),
+        );
+        assert_eq!(
+            value,
+            DataValue::Array(vec![
+                DataValue::Int(i64::MAX),
+                // 超出 i64 范围的无符号整数保留为 UInt
+                DataValue::UInt(u64::MAX),
+                DataValue::Int(-3),
+                DataValue::Float(2.25),
+            ])
+        );
+    }
+
+    #[test]
+    fn test_parse_json_string_null_and_empty() {
+        assert_eq!(
+            parse_json_string_to_data_value("[null]".to_string()),
+            DataValue::Array(vec![DataValue::Null])
+        );
+        assert_eq!(
+            parse_json_string_to_data_value("{}".to_string()),
+            DataValue::Object(HashMap::new())
+        );
+    }
+
+    #[test]
+    fn test_parse_json_string_falls_back_to_string() {
+        // 以 '[' 或 '{' 开头但不是合法JSON时保留原字符串
+        let invalid = "[1, 2".to_string();
+        assert_eq!(
+            parse_json_string_to_data_value(invalid.clone()),
+            DataValue::String(invalid)
+        );
+
+        // 非JSON格式直接作为字符串
+        assert_eq!(
+            parse_json_string_to_data_value("plain".to_string()),
+            DataValue::String("plain".to_string())
+        );
+        assert_eq!(
+            parse_optional_json_string_to_data_value(None),
+            DataValue::Null
+        );
+    }
+}
@@ -66,8 +66,20 @@ pub fn utc_to_timezone(
 }
 
 pub fn process_data_fields_from_metadata(
+    data_map: std::collections::HashMap<String, DataValue>,
+    fields: &std::collections::HashMap<String, crate::model::FieldDefinition>,
+) -> std::collections::HashMap<String, DataValue> {
+    convert_fields_from_metadata(data_map, fields, true)
+}
+
+/// 根据模型元数据转换字段值，供本模块与 `crate::process_data_fields_from_metadata` 共用
+///
+/// `normalize_datetime_with_tz` 为 true 时，额外把 DateTimeWithTz 字段的
+/// String / DateTimeUTC 值统一转换为 DateTime
+pub(crate) fn convert_fields_from_metadata(
     mut data_map: std::collections::HashMap<String, DataValue>,
     fields: &std::collections::HashMap<String, crate::model::FieldDefinition>,
+    normalize_datetime_with_tz: bool,
 ) -> std::collections::HashMap<String, DataValue> {
     for (field_name, field_def) in fields {
         if let Some(current_value) = data_map.get::<str>(field_name) {
@@ -123,7 +135,8 @@ pub fn process_data_fields_from_metadata(
                 }
                 // 处理DateTimeWithTz字段的String类型转换
                 DataValue::String(s)
-                    if matches!(
+                    if normalize_datetime_with_tz
+                        && matches!(
                         field_def.field_type,
                         crate::model::FieldType::DateTimeWithTz { .. }
                     ) =>
@@ -153,7 +166,8 @@ pub fn process_data_fields_from_metadata(
                 }
                 // 处理DateTimeWithTz字段的DateTimeUTC类型转换
                 DataValue::DateTimeUTC(dt)
-                    if matches!(
+                    if normalize_datetime_with_tz
+                        && matches!(
                         field_def.field_type,
                         crate::model::FieldType::DateTimeWithTz { .. }
                     ) =>